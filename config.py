@@ -1,6 +1,8 @@
 
 config = {
     "DEFAULT_NOTE_EDITOR": "vim",
+    # set it to "DELETE" if the notes are in a network filesystem
+    "NOTES_DB_JOURNAL_MODE": "WAL",
     "FIGURES_DIRECTORY_NAME": "graphics",
     "DEFAULT_LATEXMKRC_TEMPLATE": """ensure_path( 'TEXINPUTS', '../../styles//' );""",
     "DEFAULT_LATEX_SUBFILE_SOURCE_CODE": r"""\documentclass[class=memoir, crop=false, oneside, 14pt]{standalone}
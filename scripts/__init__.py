@@ -1,4 +1,2 @@
 import scripts.constants
-import scripts.helper
-import scripts.manager
 import scripts.cli
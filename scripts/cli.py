@@ -1,15 +1,13 @@
 # native packages
 from argparse import ArgumentParser, HelpFormatter
+from importlib import import_module
 import logging
 from pathlib import Path
 import sys
 
 # custom packages
 import scripts.constants as constants
-from .exceptions import ProfileAlreadyExistsError
-from .helper import import_config
-from .manager import create_profile, get_profile
-from .interface import add_note, remove_note, compile_note, open_note, list_note
+from .exceptions import ProfileDoesNotExistsError
 
 
 # Making between each option to have a newline for easier reading
@@ -19,19 +17,41 @@ class BlankLinesHelpFormatter(HelpFormatter):
         return super()._split_lines(text, width) + ['']
 
 
-def cli(arguments):
-    argument_parser = ArgumentParser(description="A simple LaTeX notes manager "
-                                                 "specifically created for my workflow.",
-                                     prog=constants.SHORT_NAME,
-                                     formatter_class=BlankLinesHelpFormatter)
-    argument_parser.add_argument("--target", "-t", action="store", help="The notes directory target path.", default=constants.CURRENT_DIRECTORY)
-    argument_parser.add_argument("--config", "-c", action="store", help="The config target path.", default=constants.CURRENT_DIRECTORY / "config.py")
+def add_note_argument(parser, help_text):
+    """
+    Adds the note option (`--note`) shared by the subcommands that accepts a note metalist.
 
-    # add the parsers for the subcommands
-    subparsers = argument_parser.add_subparsers(title="subcommands", dest=constants.SUBCOMMAND_ATTRIBUTE_NAME,
-                                                help="You can append a help option (-h) for each subcommand "
-                                                     "to see their arguments and available options.")
+    :param parser: The subcommand parser.
+    :type parser: ArgumentParser
+
+    :param help_text: The help message of the option for the subcommand.
+    :type help_text: str
+
+    :return: The resulting argparse action.
+    """
+    return parser.add_argument("--note", "-n", action="append", nargs="+", type=str,
+                               metavar=("SUBJECT", "TITLE"), dest=constants.NOTE_ATTRIBUTE_NAME,
+                               help=help_text)
+
+
+def add_subject_argument(parser, help_text):
+    """
+    Adds the subject option (`--subject`) shared by the subcommands that accepts a subject metalist.
 
+    :param parser: The subcommand parser.
+    :type parser: ArgumentParser
+
+    :param help_text: The help message of the option for the subcommand.
+    :type help_text: str
+
+    :return: The resulting argparse action.
+    """
+    return parser.add_argument("--subject", "-s", action="append", nargs="*", type=str,
+                               metavar=("SUBJECT"), dest=constants.SUBJECT_ATTRIBUTE_NAME,
+                               help=help_text)
+
+
+def build_list_parser(subparsers):
     # add the subcommand 'get'
     list_note_parser = subparsers.add_parser("list", formatter_class=BlankLinesHelpFormatter,
                                              help="Get a list of notes/subjects from the database.")
@@ -39,66 +59,67 @@ def cli(arguments):
                                   help="An array of subjects delimited by whitespace to list its notes in the "
                                        "database. You can list all of the subjects and their notes by providing "
                                        "one of the arguments to be \":all:\".")
-    list_note_parser.add_argument("--sort", type=str, metavar="TYPE", default="title",
+    list_note_parser.add_argument("--sort", type=str, metavar="TYPE", default="title", choices=("title", "id", "date"),
                                   help="Gives the result in a specified order. Can only accept limited keywords. Such "
                                        "keywords include \"title\", \"id\", and \"date\". By default, it lists the "
                                        "notes by title.")
-    list_note_parser.set_defaults(subcmd_func=list_note, subcmd_parser=list_note_parser)
+    list_note_parser.set_defaults(subcmd_func="list_note")
+    return list_note_parser
 
+
+def build_add_parser(subparsers):
     # add the subcommand 'add'
     add_note_parser = subparsers.add_parser("add", formatter_class=BlankLinesHelpFormatter,
                                             help="Add a note/subject in the appropriate location "
                                                  "at the notes directory.")
-    add_note_parser.add_argument("--note", "-n", action="append", nargs="+", type=str,
-                                 metavar=("SUBJECT", "TITLE"), dest=constants.NOTE_ATTRIBUTE_NAME,
-                                 help="Takes a subject as the first argument "
-                                      "then the title of the note(s) to be added. \n\n"
-                                      "This option can also be passed multiple times in one command query.")
-    add_note_parser.add_argument("--subject", "-s", action="append", nargs="*", type=str,
-                                 metavar=("SUBJECT"),
-                                 dest=constants.SUBJECT_ATTRIBUTE_NAME,
-                                 help="Takes a list of subjects to be added into the notes directory.")
+    add_note_argument(add_note_parser, "Takes a subject as the first argument "
+                                       "then the title of the note(s) to be added. \n\n"
+                                       "This option can also be passed multiple times in one command query.")
+    add_subject_argument(add_note_parser, "Takes a list of subjects to be added into the notes directory.")
     add_note_parser.add_argument("--force", action="store_true", help="Force to write the file if the note exists "
                                                                       "in the filesystem.")
-    add_note_parser.set_defaults(subcmd_func=add_note, subcmd_parser=add_note_parser)
+    add_note_parser.set_defaults(subcmd_func="add_note")
+    return add_note_parser
+
 
+def build_remove_parser(subparsers):
     # add the subcommand 'remove'
     remove_note_parser = subparsers.add_parser("remove", aliases=["rm"],
                                                formatter_class=BlankLinesHelpFormatter,
                                                help="Remove a subject/note from the binder.")
-    remove_note_parser.add_argument("--note", "-n", action="append", nargs="+", type=str,
-                                    metavar=("SUBJECT", "TITLE"), dest=constants.NOTE_ATTRIBUTE_NAME,
-                                    help="Takes a subject as the first argument and the title of the note(s) "
-                                         "to be deleted as the rest. You can delete all of the notes on a "
-                                         "subject by providing one of the argument as ':all:'. "
-                                         "This option can also be passed multiple times in one command query.")
-    remove_note_parser.add_argument("--subject", "-s", action="append", nargs="*", type=str,
-                                    metavar=("SUBJECT"), dest=constants.SUBJECT_ATTRIBUTE_NAME,
-                                    help="Takes a list of subjects to be removed into the binder database.")
+    add_note_argument(remove_note_parser, "Takes a subject as the first argument and the title of the note(s) "
+                                          "to be deleted as the rest. You can delete all of the notes on a "
+                                          "subject by providing one of the argument as ':all:'. "
+                                          "This option can also be passed multiple times in one command query.")
+    add_subject_argument(remove_note_parser, "Takes a list of subjects to be removed into the binder database.")
     remove_note_parser.add_argument("--delete", action="store_true", help="Delete the files on disk.")
 
-    remove_note_parser.set_defaults(subcmd_func=remove_note, subcmd_parser=remove_note_parser)
+    remove_note_parser.set_defaults(subcmd_func="remove_note")
+    return remove_note_parser
+
 
+def build_compile_parser(subparsers):
     # add the subcommand 'compile'
     compile_note_parser = subparsers.add_parser("compile", aliases=["make"], formatter_class=BlankLinesHelpFormatter,
                                                 help="Compile specified notes from a subject or a variety of them.")
-    compile_note_parser.add_argument("--note", "-n", action="append", nargs="+", type=str,
-                                     metavar=("SUBJECT", "TITLE"), dest=constants.NOTE_ATTRIBUTE_NAME,
-                                     help="Takes a subject as the first argument then the title of the note(s) "
-                                          "to be compiled which can vary in count. "
-                                          "You can compile all of the notes by providing the argument ':all:' as the "
-                                          "first argument (i.e., '--note :all:'). "
-                                          "You can compile all of the notes under a subject by providing ':all:' as "
-                                          "the second argument (i.e., '--note <SUBJECT_NAME> :all:'). "
-                                          "This option can also be passed multiple times in one command query.")
+    add_note_argument(compile_note_parser, "Takes a subject as the first argument then the title of the note(s) "
+                                           "to be compiled which can vary in count. "
+                                           "You can compile all of the notes by providing the argument ':all:' as "
+                                           "the first argument (i.e., '--note :all:'). "
+                                           "You can compile all of the notes under a subject by providing ':all:' "
+                                           "as the second argument (i.e., '--note <SUBJECT_NAME> :all:'). "
+                                           "This option can also be passed multiple times in one command query.")
     compile_note_parser.add_argument("--cache", action="store_true",
                                      help=f"Specifies if the build directory "
                                      f"(DEFAULT: {constants.TEMP_DIRECTORY_NAME}) should be kept after compilation "
                                      f"process has completed. This will help out in speeding up compilation time "
                                      f"especially if you're going to compile continuously.")
 
-    compile_note_parser.set_defaults(subcmd_func=compile_note, subcmd_parser=compile_note_parser)
+    compile_note_parser.set_defaults(subcmd_func="compile_note")
+    return compile_note_parser
+
 
+def build_open_parser(subparsers):
     # add the subcommand 'open'
     open_note_parser = subparsers.add_parser("open", formatter_class=BlankLinesHelpFormatter,
                                              help="Open up specified note with the default/configured text editor.")
@@ -110,45 +131,126 @@ def cli(arguments):
                                   "given command. You have to indicate the note with \"{note}\" "
                                   "(i.e. \"code {note}\").")
 
-    open_note_parser.set_defaults(subcmd_func=open_note, subcmd_parser=open_note_parser)
+    open_note_parser.set_defaults(subcmd_func="open_note")
+    return open_note_parser
 
-    args = vars(argument_parser.parse_args())
-    passed_subcommand = args.pop(constants.SUBCOMMAND_ATTRIBUTE_NAME, None)
-    if passed_subcommand is None or len(arguments) == 1:
-        argument_parser.print_help()
-        sys.exit(0)
 
-    if passed_subcommand is not None:
-        note_function = args.pop("subcmd_func", None)
+# The subcommand parsers are only built when needed since only one of them is used for each invocation.
+# Take note that the aliases of the subcommands are also included here.
+SUBCOMMAND_PARSER_BUILDERS = {
+    "list": build_list_parser,
+    "add": build_add_parser,
+    "remove": build_remove_parser,
+    "rm": build_remove_parser,
+    "compile": build_compile_parser,
+    "make": build_compile_parser,
+    "open": build_open_parser,
+}
+
+# The top-level options that takes a value which has to be skipped when searching for the subcommand.
+TOP_LEVEL_VALUE_OPTIONS = ("--target", "-t", "--config", "-c")
+
 
-        passed_subcommand_parser = args.pop("subcmd_parser", None)
+def find_subcommand(arguments):
+    """
+    Finds the subcommand from the raw command-line arguments without building the whole parser.
+
+    :param arguments: The command-line arguments without the program name.
+    :type arguments: list[str]
+
+    :return: The name of the subcommand (or alias) or None if there's no subcommand given.
+    :rtype: str
+    """
+    skip_value = False
+    for argument in arguments:
+        if skip_value:
+            skip_value = False
+            continue
+
+        if argument in TOP_LEVEL_VALUE_OPTIONS:
+            skip_value = True
+            continue
+
+        if argument.startswith("-"):
+            continue
+
+        return argument
+
+    return None
+
+
+def cli(arguments):
+    argument_parser = ArgumentParser(description="A simple LaTeX notes manager "
+                                                 "specifically created for my workflow.",
+                                     prog=constants.SHORT_NAME,
+                                     formatter_class=BlankLinesHelpFormatter)
+    argument_parser.add_argument("--target", "-t", action="store", help="The notes directory target path.", default=constants.CURRENT_DIRECTORY)
+    argument_parser.add_argument("--config", "-c", action="store", help="The config target path.", default=constants.CURRENT_DIRECTORY / "config.py")
+
+    # add the parsers for the subcommands
+    subparsers = argument_parser.add_subparsers(title="subcommands", dest=constants.SUBCOMMAND_ATTRIBUTE_NAME,
+                                                help="You can append a help option (-h) for each subcommand "
+                                                     "to see their arguments and available options.")
+
+    # only build the parser of the given subcommand
+    # if there's none (or it is an invalid one), all of them are built for the help message
+    subcommand_parser_builder = SUBCOMMAND_PARSER_BUILDERS.get(find_subcommand(arguments[1:]), None)
+    if subcommand_parser_builder is not None:
+        subcommand_parser = subcommand_parser_builder(subparsers)
 
         # Printing the help message if there's no value added
         if len(arguments) == 2:
-            passed_subcommand_parser.print_help()
+            subcommand_parser.print_help()
+            sys.exit(0)
+    else:
+        for builder in dict.fromkeys(SUBCOMMAND_PARSER_BUILDERS.values()):
+            builder(subparsers)
+
+        # there's no need to parse anything with a bare invocation
+        if len(arguments) == 1:
+            argument_parser.print_help()
             sys.exit(0)
 
-        # setting up the logger for the file
-        logging.basicConfig(filename=constants.SHORT_NAME + ".log", filemode="w", level=logging.INFO,
-                            format="%(levelname)s (%(asctime)s):\n%(message)s\n")
-        logging.info("Subcommand: {subcmd}".format(subcmd=passed_subcommand))
+    args = vars(argument_parser.parse_args(arguments[1:]))
+    passed_subcommand = args.pop(constants.SUBCOMMAND_ATTRIBUTE_NAME, None)
+    if passed_subcommand is None:
+        argument_parser.print_help()
+        sys.exit(0)
+
+    # the modules for the notes are only needed once there's a subcommand to be executed
+    from .helper import import_config, close_dbs
+    from .manager import create_profile, get_profile
+
+    # the subcommand function is referred only by name from the parser
+    note_function = getattr(import_module(".interface", __package__), args.pop("subcmd_func"))
+
+    # setting up the logger for the file
+    # the log file is only opened (and truncated) once there's something to be logged
+    log_file_handler = logging.FileHandler(constants.SHORT_NAME + ".log", mode="w", delay=True)
+    logging.basicConfig(handlers=[log_file_handler], level=logging.INFO,
+                        format="%(levelname)s (%(asctime)s):\n%(message)s\n")
+
+    # the console messages are also passed to the log file through the root logger
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.getLogger(constants.CONSOLE_LOGGER_NAME).addHandler(console_handler)
+    logging.info("Subcommand: {subcmd}".format(subcmd=passed_subcommand))
 
-        location = Path(args.pop("target", constants.CURRENT_DIRECTORY))
-        profile_directory = location / constants.PROFILE_DIRECTORY_NAME
-        notes_directory = profile_directory / "notes"
+    location = Path(args.pop("target", constants.CURRENT_DIRECTORY))
 
-        config = args.pop("config", None)
-        if config is not None:
-            config = Path(config)
+    config = args.pop("config", None)
+    if config is not None:
+        config = Path(config)
 
-            if config.exists():
-                user_config = import_config("config", config).config
-                constants.config.update(user_config)
+        if config.exists():
+            user_config = import_config("config", config).config
+            constants.config.update(user_config)
 
-        if profile_directory.exists():
-            profile_metadata = get_profile(location)
-        else:
-            profile_metadata = create_profile(location)
+    # `get_profile` already checks if the profile exists
+    try:
+        profile_metadata = get_profile(location)
+    except ProfileDoesNotExistsError:
+        profile_metadata = create_profile(location)
 
-        note_function(**args, metadata=profile_metadata)
-        profile_metadata["db"].close()
+    note_function(**args, metadata=profile_metadata)
+    close_dbs()
@@ -1,7 +1,8 @@
+from functools import lru_cache
 from pathlib import Path
 from string import Template
 
-__all__ = ["PROGRAM_NAME", "SHORT_NAME",
+__all__ = ["PROGRAM_NAME", "SHORT_NAME", "CONSOLE_LOGGER_NAME",
            "CURRENT_DIRECTORY", "NOTES_DIRECTORY", "STYLE_DIRECTORY", "TEMP_DIRECTORY", "OUTPUT_DIRECTORY",
            
            "NOTE_ATTRIBUTE_NAME", "SUBJECT_ATTRIBUTE_NAME",
@@ -14,7 +15,9 @@ __all__ = ["PROGRAM_NAME", "SHORT_NAME",
            "INVALID_SUBJECT_NAMES", "INVALID_NOTE_TITLES",
 
            # SQL-related stuff
-           "NOTES_DB_SQL_SCHEMA", "NOTES_DB_FILEPATH",
+           "NOTES_DB_SQL_SCHEMA", "NOTES_DB_SQL_STATEMENTS", "NOTES_DB_FILEPATH", "NOTES_DB_MAX_QUERY_VARIABLES",
+           "NOTES_DB_CACHED_STATEMENTS", "NOTES_DB_SYNCHRONOUS", "NOTES_DB_TEMP_STORE", "NOTES_DB_CACHE_SIZE",
+           "NOTES_DB_MAX_MMAP_SIZE", "NOTES_DB_ANALYSIS_LIMIT",
 
            # LaTeX raw source code
            "DEFAULT_LATEX_MAIN_FILE_SOURCE_CODE", "DEFAULT_LATEX_SUBFILE_SOURCE_CODE",
@@ -33,7 +36,10 @@ __all__ = ["PROGRAM_NAME", "SHORT_NAME",
 PROGRAM_NAME = "Simple Personal Lecture Manager"
 SHORT_NAME = "personal-lecture-manager"
 
-CURRENT_DIRECTORY = Path("./")
+# the name of the logger for the messages that are also printed in the console
+CONSOLE_LOGGER_NAME = SHORT_NAME + ".console"
+
+CURRENT_DIRECTORY = Path(".")
 
 PROFILE_DIRECTORY_NAME = "texture-notes-profile"
 PROFILE_DIRECTORY = CURRENT_DIRECTORY / PROFILE_DIRECTORY_NAME
@@ -48,12 +54,40 @@ TEMP_DIRECTORY_NAME = ".tmp"
 
 NOTES_DB_FILENAME = "notes.db"
 
+# the version of the database schema to be recorded in the `user_version` of the database once it is initialized
+NOTES_DB_SCHEMA_VERSION = 1
+
+# the maximum number of values to be bound in one `IN (...)` query
+# older versions of SQLite have a limit of 999 variables for each statement
+NOTES_DB_MAX_QUERY_VARIABLES = 500
+
+# the number of prepared statements to be kept by each database connection
+# take note the statements are only reused if they have the same SQL text so bind the values as parameters
+NOTES_DB_CACHED_STATEMENTS = 512
+
+# the settings for each database connection (see `configure_db` in `$PROJECT_ROOT/scripts/helper.py`)
+# the journal mode is set in the config instead since the write-ahead log doesn't work with network filesystems
+NOTES_DB_SYNCHRONOUS = "NORMAL"
+NOTES_DB_TEMP_STORE = "MEMORY"
+
+# a negative value is the size in kibibytes instead of the number of pages
+# the page cache is only filled as pages are read so it adds up to 64 MB of memory for each connection at most
+NOTES_DB_CACHE_SIZE = -64000
+
+# the memory-mapped size of the database is twice of its file size up to this limit (in bytes)
+# the mapped pages are shared with the page cache of the OS so they are counted in the RSS but they can be reclaimed
+NOTES_DB_MAX_MMAP_SIZE = 268435456
+
+# the number of rows to be examined for each index when the statistics of the database are updated before closing
+NOTES_DB_ANALYSIS_LIMIT = 1000
+
 NOTE_ATTRIBUTE_NAME = "note_metalist"
 SUBJECT_ATTRIBUTE_NAME = "subject_metalist"
 SUBCOMMAND_ATTRIBUTE_NAME = "subcommand"
 
 config = {
     "DEFAULT_NOTE_EDITOR": "vim",
+    "NOTES_DB_JOURNAL_MODE": "WAL",
     "FIGURES_DIRECTORY_NAME": "graphics",
     "DEFAULT_LATEXMKRC_TEMPLATE": """ensure_path( 'TEXINPUTS', '../../styles//' );""",
     "DEFAULT_LATEX_SUBFILE_SOURCE_CODE": r"""\documentclass[class=memoir, crop=false, oneside, 14pt]{standalone}
@@ -160,24 +194,33 @@ DEFAULT_LATEX_DOC_CONFIG = {
     "author": "Gabriel Arazas",
 }
 
-INVALID_SUBJECT_NAMES = (":all:", ":except:")
-INVALID_NOTE_TITLES = (":all:", ":main:", ":union:", "stylesheets", "graphics", "readme", "main")
+# take note that the names are in lowercase since they are checked case-insensitively
+INVALID_SUBJECT_NAMES = frozenset((":all:", ":except:"))
+INVALID_NOTE_TITLES = frozenset((":all:", ":main:", ":union:", "stylesheets", "graphics", "readme", "main"))
 
 SUBJECT_NAME_REGEX = r"^[\w\d -]+$"
 
-NOTES_DB_SQL_SCHEMA = rf"""/*
-One thing to note here is the REGEXP function.
-The version that the SQLite version to be used with this app (3.28)
-doesn't have any by default and it has to be user-defined.
 
-The REGEXP function can be found in `$PROJECT_ROOT/scripts/helper.py`
-as function `regex_match`.
-*/
+def _build_sql_string_list(values):
+    """
+    Renders the given strings into an SQL list of string literals (e.g., `('a', 'b')`) in a stable order.
 
--- enabling foreign keys since SQLite 3.x has it disabled by default
-PRAGMA foreign_keys = ON;
+    :param values: The strings to be rendered.
+    :type values: frozenset[str]
 
-CREATE TABLE IF NOT EXISTS "subjects" (
+    :return: The SQL list.
+    :rtype: str
+    """
+    return "(" + ", ".join(f"'{value}'" for value in sorted(values)) + ")"
+
+
+# The statements of the schema are built on their first access (see `__getattr__` at the end of the module).
+# They are kept as separate statements so they can be executed one by one in a single transaction.
+def _build_notes_db_sql_statements():
+    invalid_subject_names_sql = _build_sql_string_list(INVALID_SUBJECT_NAMES)
+    invalid_note_titles_sql = _build_sql_string_list(INVALID_NOTE_TITLES)
+
+    create_subjects_table = rf"""CREATE TABLE IF NOT EXISTS "subjects" (
     "id" INTEGER,
     "name" TEXT UNIQUE NOT NULL,
     "datetime_modified" DATETIME NOT NULL,
@@ -185,16 +228,15 @@ CREATE TABLE IF NOT EXISTS "subjects" (
     CHECK(
         TYPEOF("name") == "text" AND
         LENGTH("name") <= 128 AND
-        REGEXP("name", "^[\w\d -]+") AND 
-        LOWER("name") NOT IN {INVALID_SUBJECT_NAMES} AND 
+        LOWER("name") NOT IN {invalid_subject_names_sql} AND 
         
         -- checking if the datetime is indeed in ISO format
         TYPEOF("datetime_modified") == "text" AND
-        REGEXP("datetime_modified", "^\d{{4}}-\d{{2}}-\d{{2}} \d{{2}}:\d{{2}}:\d{{2}}$")
+        "datetime_modified" GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9] [0-9][0-9]:[0-9][0-9]:[0-9][0-9]'
     )
-);
+);"""
 
-CREATE TABLE IF NOT EXISTS "notes" (
+    create_notes_table = rf"""CREATE TABLE IF NOT EXISTS "notes" (
     "id" INTEGER,
     "title" TEXT NOT NULL,
     "subject_id" INTEGER NOT NULL,
@@ -207,19 +249,19 @@ CREATE TABLE IF NOT EXISTS "notes" (
         -- checking if the title is a string with less than 512 characters
         TYPEOF("title") == "text" AND
         LENGTH("title") <= 256 AND
-        LOWER("title") NOT IN {INVALID_NOTE_TITLES} AND
+        LOWER("title") NOT IN {invalid_note_titles_sql} AND
 
         -- checking if the datetime is indeed in ISO format
         TYPEOF("datetime_modified") == "text" AND
-        REGEXP("datetime_modified", "^\d{{4}}-\d{{2}}-\d{{2}} \d{{2}}:\d{{2}}:\d{{2}}$")
+        "datetime_modified" GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9] [0-9][0-9]:[0-9][0-9]:[0-9][0-9]'
     )
-);
+);"""
 
--- creating a trigger on "notes" table which will check the uniqueness of the
--- filename of the incoming note for a subject; in other words, there may be duplicates of
--- the note with the same filename in two or more different subjects but not under
--- the same subject
-CREATE TRIGGER IF NOT EXISTS unique_filename_note_check
+    # creating a trigger on "notes" table which will check the uniqueness of the
+    # filename of the incoming note for a subject; in other words, there may be duplicates of
+    # the note with the same filename in two or more different subjects but not under
+    # the same subject
+    create_unique_filename_trigger = r"""CREATE TRIGGER IF NOT EXISTS unique_filename_note_check
 BEFORE INSERT ON notes
 BEGIN
     SELECT
@@ -227,11 +269,30 @@ BEGIN
         WHEN (SELECT COUNT(title) FROM notes WHERE subject_id == NEW.subject_id AND title == NEW.title) >= 1
             THEN RAISE(FAIL, "There's already a note with the same title under the specified subject.")
     END;
-END;
+END;"""
+
+    # creating an index for the notes
+    create_notes_index = r"""CREATE INDEX IF NOT EXISTS notes_index ON "notes"("title", "subject_id");"""
+
+    return create_subjects_table, create_notes_table, create_unique_filename_trigger, create_notes_index
+
+
+# the whole schema as an SQL script
+def _build_notes_db_sql_schema():
+    return r"""/*
+One thing to note here is the constraints only use the built-in SQLite functions.
+The names of the subjects are validated in the Python side before insertion
+(see `create_subject` in `$PROJECT_ROOT/scripts/manager.py`).
+
+Older databases used the user-defined REGEXP function for the constraints which is
+why it is still registered in `$PROJECT_ROOT/scripts/helper.py` as function `regex_match`.
+*/
+
+-- enabling foreign keys since SQLite 3.x has it disabled by default
+PRAGMA foreign_keys = ON;
+
+""" + "\n\n".join(__getattr__("NOTES_DB_SQL_STATEMENTS")) + "\n"
 
--- creating an index for the notes
-CREATE INDEX IF NOT EXISTS notes_index ON "notes"("title", "subject_id");
-"""
 
 # TODO: Make configurable templates for main and subfiles
 DEFAULT_LATEX_MAIN_FILE_DOC_KEY_LIST = []
@@ -265,9 +326,6 @@ EXIT_CODES = {
                      "(https://github.com/foo-dogsquared/a-remote-repo-full-of-notes-of-things-i-do-not-know-about).",
 }
 
-# this is just for backup in case the .default_tex_template is not found
-DEFAULT_LATEX_MAIN_FILE_TEMPLATE = Template(config["DEFAULT_LATEX_MAIN_FILE_SOURCE_CODE"])
-DEFAULT_LATEX_SUBFILE_TEMPLATE = Template(config["DEFAULT_LATEX_SUBFILE_SOURCE_CODE"])
 
 # constants for preferences
 # TODO:
@@ -280,6 +338,61 @@ DEFAULT_MANAGER_PREFERENCES = {
     "latex-engine-enable-shell-escape": True,
     "latex-engine-enable-synctex": True,
 }
-MANAGER_PREFERENCES_FILENAME = CURRENT_DIRECTORY / "latex-note-manager.pref.json"
 
-# Default preferences for figures
\ No newline at end of file
+# Default preferences for figures
+
+
+# Use the Template instances from this function; do not reconstruct them with each use.
+# The templates are cached by their source code so templates modified from the user config are also cached.
+@lru_cache(maxsize=16)
+def get_template(source):
+    """
+    Returns the (cached) `string.Template` instance of the given source code.
+
+    :param source: The source code of the template.
+    :type source: str
+
+    :return: The template.
+    :rtype: Template
+    """
+    return Template(source)
+
+
+# The following constants are only built on their first access since most of the invocations of the program
+# doesn't need them (e.g., printing the help message).
+_LAZY_CONSTANTS_BUILDERS = {
+    "NOTES_DB_SQL_SCHEMA": _build_notes_db_sql_schema,
+    "NOTES_DB_SQL_STATEMENTS": _build_notes_db_sql_statements,
+
+    # this is just for backup in case the .default_tex_template is not found
+    "DEFAULT_LATEX_MAIN_FILE_TEMPLATE": lambda: get_template(config["DEFAULT_LATEX_MAIN_FILE_SOURCE_CODE"]),
+    "DEFAULT_LATEX_SUBFILE_TEMPLATE": lambda: get_template(config["DEFAULT_LATEX_SUBFILE_SOURCE_CODE"]),
+
+    "MANAGER_PREFERENCES_FILENAME": lambda: CURRENT_DIRECTORY / "latex-note-manager.pref.json",
+}
+_lazy_cache = {}
+
+
+def __getattr__(name):
+    """
+    Builds the lazy constants of the module on their first access and caches them (PEP 562).
+
+    :param name: The name of the constant.
+    :type name: str
+
+    :return: The value of the constant.
+
+    :raises AttributeError: When the name is not one of the lazy constants.
+    """
+    try:
+        return _lazy_cache[name]
+    except KeyError:
+        pass
+
+    try:
+        builder = _LAZY_CONSTANTS_BUILDERS[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    value = _lazy_cache[name] = builder()
+    return value
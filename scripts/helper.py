@@ -1,14 +1,29 @@
 # native packages
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+import errno
+from functools import lru_cache
 import importlib.util
+from itertools import repeat
 import logging
+import os
+from os import stat
 from re import compile
+from shutil import copyfile, rmtree
 import sqlite3
 import sys
 
 # program constants
 import scripts.constants as constants
 
+# precompiled pattern for `kebab_case` (whitespace is kept for splitting the words)
+KEBAB_CASE_INVALID_CHARACTERS_REGEX = compile(r"[^a-zA-Z0-9\s]")
+
+# precompiled patterns for validating the names of the subjects and the titles of the notes
+SUBJECT_NAME_PATTERN = compile(constants.SUBJECT_NAME_REGEX)
+NUMERIC_NAME_PATTERN = compile(r"^\d+$")
+
 
 # helper functions
 def sys_error_print(error, message=None, strict=False, file=sys.stderr):
@@ -37,31 +52,17 @@ def kebab_case(string, separator="-"):
     :param separator: The separator for the resulting list of words to be joined.
     :return: str
     """
-    whitespace_characters = compile(r"\s+|-+")
-    invalid_characters = compile(r"[^a-zA-Z0-9]")
-
-    word_list = whitespace_characters.split(string)
-    filtered_word_list = []
-
-    for word in word_list[:]:
-        if not word:
-            continue
-
-        stripped_word = invalid_characters.sub("", word)
-        if not stripped_word:
-            continue
-
-        filtered_word = stripped_word.lower()
-        filtered_word_list.append(filtered_word)
-
-    return separator.join(filtered_word_list)
+    # the hyphens are treated as whitespace and the rest of the invalid characters are simply removed
+    stripped_string = KEBAB_CASE_INVALID_CHARACTERS_REGEX.sub("", string.replace("-", " "))
+    return separator.join(stripped_string.lower().split())
 
 
 def deduplicate_list(sequence, rtuple=False):
     """
     Deduplicates a list while preserving order.
 
-    Code based in this Stack Overflow discussion (https://stackoverflow.com/a/480227).
+    Since dictionaries preserve their insertion order, the deduplicated sequence is simply the keys of a dictionary
+    made from the sequence.
 
     :param sequence: A sequence of items (list, tuple, or set).
     :type sequence: list || tuple || set
@@ -72,124 +73,496 @@ def deduplicate_list(sequence, rtuple=False):
     :return: A list (or a tuple, if specified) of the deduplicated sequence.
     :rtype: list || tuple
     """
-    seen = set()
-    seen_add = seen.add
+    deduplicated_sequence = dict.fromkeys(sequence)
 
     if rtuple is True:
-        return (item for item in sequence if not (item in seen or seen_add(item)))
+        return tuple(deduplicated_sequence)
     else:
-        return [item for item in sequence if not (item in seen or seen_add(item))]
+        return list(deduplicated_sequence)
 
 
-def build_prefix_array(pattern):
+def chunk_list(sequence, size):
     """
-    Returns a list of numbers (indexes) of the location where the given pattern from the text was found.
-    Similar to the built-in string (`str`) function `find`), it'll return -1 when no match has found.
-    :param text:
-    :param pattern:
-    :return: [int]
+    Splits a sequence into lists with the given maximum size while preserving order.
+
+    :param sequence: A sequence of items (list or tuple).
+    :type sequence: list || tuple
+
+    :param size: The maximum size of each chunk.
+    :type size: int
+
+    :return: A list of the chunks.
+    :rtype: list[list]
     """
-    # building the prefix array
-    pattern_length = len(pattern)
-    prefix_array = [0] * pattern_length
-    j = 0
+    return [list(sequence[index:index + size]) for index in range(0, len(sequence), size)]
 
-    for i in range(1, pattern_length):
-        if pattern[j] == pattern[i]:
-            prefix_array[i] = j + 1
-            j += 1
-        else:
-            j = prefix_array[j - 1]
-            prefix_array[i] = j
-            continue
 
-        i += 1
+def sql_parameter_list(values):
+    """
+    Creates the placeholders of an SQL list (e.g., `IN (?, ?, ?, ?)`) for the given values. The values are padded with
+    `NULL` (which never matches in an `IN` list) up to the next power of two so only a few statement texts are made
+    and they can be reused from the statement cache of the connection.
+
+    :param values: The values to be passed as the parameters of the list.
+    :type values: list || tuple
+
+    :return: A tuple of the placeholders string (without the parentheses) and the list of the padded parameters.
+    :rtype: tuple
+    """
+    parameter_count = 1 << max(len(values) - 1, 0).bit_length()
+    parameters = [*values, *([None] * (parameter_count - len(values)))]
+    return ", ".join("?" * parameter_count), parameters
 
-    return prefix_array
 
 def substring_search(text, pattern):
-    prefix_array = build_prefix_array(pattern)
+    """
+    Returns the lowest index of the location where the given pattern from the text was found.
+    Similar to the built-in string (`str`) function `find`, it'll return -1 when no match has found.
+    :param text: The text to be searched.
+    :param pattern: The substring to be searched for.
+    :return: int
+    """
+    return text.find(pattern)
+
+
+def get_directory_names(path):
+    """
+    Lists the names of the directories inside of the given directory. The directory is only read once with
+    `os.scandir` which already gives the type of the entries so there's no need to check each entry with `stat`.
+
+    :param path: The directory to be scanned.
+    :type path: pathlib.Path
+
+    :return: A set of the names of the directories. It is empty if the directory doesn't exist.
+    :rtype: set[str]
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return set()
 
-    # TODO:
-    # Compare the text with pattern
-    # Start by comparing the characters in the text and the pattern
-    # If the character doesn't match, go back to the previous value and start the comparison
-    #   in the index that the previous value pointed to
-    # If it's the same, then take not of the index of the text and move to the next character
 
-    # for index in characters:
-    pass
+def get_file_names(path):
+    """
+    Lists the names of the files inside of the given directory. Similar to `get_directory_names`, the directory is
+    only read once with `os.scandir`.
+
+    :param path: The directory to be scanned.
+    :type path: pathlib.Path
+
+    :return: A set of the names of the files. It is empty if the directory doesn't exist.
+    :rtype: set[str]
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+# The same paths are checked over and over within a command (e.g., a subject directory is checked each time the subject
+# is retrieved) so the results are cached. Take note to call `clear_path_caches` whenever the filesystem is modified.
+@lru_cache(maxsize=4096)
+def cached_is_dir(path):
+    return os.path.isdir(path)
+
+
+@lru_cache(maxsize=4096)
+def cached_is_file(path):
+    return os.path.isfile(path)
+
+
+def clear_path_caches():
+    """
+    Clears the cached results of `cached_is_dir` and `cached_is_file`.
+
+    :return: Has no return value.
+    :rtype: None
+    """
+    cached_is_dir.cache_clear()
+    cached_is_file.cache_clear()
+
+
+# the maximum number of threads for deleting files and folders
+# the deletions are mostly waiting on the filesystem so it is not based from the CPU count
+MAX_DELETION_WORKERS = 8
+
+
+def delete_path(path, directory=False):
+    """
+    Deletes the given file or folder (with its contents). It does nothing if the path doesn't exist.
+
+    :param path: The path to be deleted.
+    :type path: pathlib.Path
+
+    :param directory: Indicates if the path is a folder.
+    :type directory: bool
+
+    :return: Has no return value.
+    :rtype: None
+    """
+    # `rmtree` already goes through the folder with `os.scandir` using the file types from the directory entries so
+    # the files are not stat'ed one by one, it also guards against symlink attacks with file descriptors when it can
+    if directory is True:
+        rmtree(path, ignore_errors=True)
+    else:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def delete_paths(paths, directories=False):
+    """
+    Deletes the given files or folders. The deletions are done concurrently since they're mostly waiting on the
+    filesystem.
+
+    :param paths: The paths to be deleted.
+    :type paths: list[pathlib.Path]
+
+    :param directories: Indicates if the paths are folders.
+    :type directories: bool
+
+    :return: Has no return value.
+    :rtype: None
+    """
+    if len(paths) <= 1:
+        for path in paths:
+            delete_path(path, directories)
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(paths), MAX_DELETION_WORKERS)) as executor:
+            # the results are consumed to raise the errors from the threads
+            list(executor.map(delete_path, paths, repeat(directories)))
+
+    clear_path_caches()
+
+
+# the number of bytes to be copied for each `os.copy_file_range` call
+COPY_FILE_RANGE_CHUNK_SIZE = 2 ** 30
+
+
+def copy_file(source, destination):
+    """
+    Copies the contents of a file into the destination. Unlike `shutil.copy`, the permission bits are not copied.
+
+    On Linux, the file is copied with `os.copy_file_range` which lets the kernel do the copying within the filesystem
+    (or even share the data blocks on copy-on-write filesystems). It falls back to `shutil.copyfile` and its
+    platform-specific fast paths (e.g., `sendfile` on Linux, `fcopyfile` on macOS) if it isn't available.
+
+    :param source: The path of the file to be copied.
+    :type source: pathlib.Path
+
+    :param destination: The path of the copy. If it's a directory, the file is copied inside of it with the same name.
+    :type destination: pathlib.Path
+
+    :return: The path of the copy.
+    :rtype: pathlib.Path
+    """
+    if destination.is_dir():
+        destination = destination / source.name
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+                while os.copy_file_range(source_file.fileno(), destination_file.fileno(),
+                                         COPY_FILE_RANGE_CHUNK_SIZE) > 0:
+                    pass
+            return destination
+        except OSError as error:
+            # the files are not supported by the system call (e.g., they're in different filesystems on older kernels)
+            # it is simply copied again from the start
+            if error.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ETXTBSY):
+                raise error
+
+    copyfile(source, destination)
+    return destination
+
+
+# The same few patterns are used over and over (especially with the `REGEXP` SQL function) so the compiled
+# patterns are cached.
+compile_regex = lru_cache(maxsize=64)(compile)
 
 
 def regex_match(string, pattern):
-    regex_pattern = compile(pattern)
+    regex_pattern = compile_regex(pattern)
     return regex_pattern.search(string) is not None
 
 
+# the imported config modules with the modification time and size of their file at the time of the import
+IMPORTED_CONFIG_CACHE = {}
+
+
 # Taken from https://stackoverflow.com/a/67692
 def import_config(name, location):
+    """
+    Imports the given file as a module. The module is cached and it is only executed again if the file has been
+    changed since then (checked by its modification time and size).
+
+    :param name: The name of the module.
+    :type name: str
+
+    :param location: The path of the file to be imported.
+    :type location: pathlib.Path
+
+    :return: The imported module.
+    :rtype: module
+    """
+    location_stat = stat(location)
+    file_signature = (location_stat.st_mtime_ns, location_stat.st_size)
+
+    cached_config = IMPORTED_CONFIG_CACHE.get((name, location), None)
+    if cached_config is not None and cached_config[0] == file_signature:
+        return cached_config[1]
+
     spec = importlib.util.spec_from_file_location(name, location)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
+
+    IMPORTED_CONFIG_CACHE[(name, location)] = (file_signature, module)
     return module
 
 
+# `RETURNING` clauses are only supported starting with SQLite v3.35.0
+SQLITE_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def configure_db(notes_db, db_path):
+    """
+    Applies the settings of the database connection. These settings only applies to the current connection so they
+    have to be set every time. They are applied as the connection is opened before any transaction starts since some
+    of them (e.g., the journal mode) cannot be changed within a transaction.
+
+    :param notes_db: The database connection to be configured.
+    :type notes_db: sqlite3.Connection
+
+    :param db_path: The path of the database. It is used for sizing the memory-mapped I/O of the database.
+    :type db_path: pathlib.Path
+
+    :return: The configured database connection.
+    :rtype: sqlite3.Connection
+    """
+    try:
+        db_size = stat(db_path).st_size
+    except OSError:
+        db_size = 0
+
+    notes_db.execute("PRAGMA foreign_keys = ON;")
+
+    # SQLite falls back to another journal mode if the configured one is not supported (e.g., WAL on some network
+    # filesystems) so it is checked from the result
+    journal_mode = constants.config["NOTES_DB_JOURNAL_MODE"]
+    applied_journal_mode = notes_db.execute(f"PRAGMA journal_mode = {journal_mode};").fetchone()["journal_mode"]
+    if applied_journal_mode.upper() != journal_mode.upper():
+        logging.warning(f"The database at '{db_path}' uses the journal mode '{applied_journal_mode}' instead of "
+                        f"the configured '{journal_mode}'.")
+
+    notes_db.execute(f"PRAGMA synchronous = {constants.NOTES_DB_SYNCHRONOUS};")
+    notes_db.execute(f"PRAGMA temp_store = {constants.NOTES_DB_TEMP_STORE};")
+    notes_db.execute(f"PRAGMA cache_size = {constants.NOTES_DB_CACHE_SIZE};")
+    notes_db.execute(f"PRAGMA mmap_size = {min(db_size * 2, constants.NOTES_DB_MAX_MMAP_SIZE)};")
+    return notes_db
+
+
+@lru_cache(maxsize=64)
+def get_column_names(description):
+    return tuple(column[0] for column in description)
+
+
+def dict_row_factory(cursor, row):
+    """
+    The row factory of the database connections. The rows are made into dictionaries right away so they can be
+    extended without copying the row into another dictionary. The column names are cached by the description of the
+    statement.
+
+    :param cursor: The cursor where the row came from.
+    :type cursor: sqlite3.Cursor
+
+    :param row: The row as a tuple of values.
+    :type row: tuple
+
+    :return: A dictionary of the row with the column names as the keys.
+    :rtype: dict
+    """
+    return dict(zip(get_column_names(cursor.description), row))
+
+
 def initialized_db(db_path=constants.CURRENT_DIRECTORY / constants.PROFILE_DIRECTORY_NAME / constants.NOTES_DB_FILENAME):
     """
     Simply returns an initialized database. Useful if you're intending to use the same database connection throughout
     the program runtime.
 
+    The connection doesn't open transactions by itself (`isolation_level=None`) so the transactions are only opened
+    with `use_db` and several statements can be grouped in one transaction. The connection is also left bound to the
+    thread that created it since none of the worker threads (e.g., for compiling and deleting files) need the
+    database. The threading mode of SQLite itself (`sqlite3.threadsafety`) cannot be set per connection from the
+    standard library so the connection keeps the mode the library was compiled with.
+
     :param db_path: The name (path) of the database to be initialized.
     :type db_path: pathlib.Path
 
     :return: A Python SQLite3 Connection object with the initialization has already taken place.
     :rtype: sqlite3.Connection
     """
-    notes_db = sqlite3.connect(db_path)
-    notes_db.row_factory = sqlite3.Row
+    # the transactions are explicitly managed with `use_db`
+    notes_db = sqlite3.connect(db_path, isolation_level=None, cached_statements=constants.NOTES_DB_CACHED_STATEMENTS)
+    notes_db.row_factory = dict_row_factory
+
+    # the functions always give the same results with the same arguments which lets SQLite optimize their use
+    notes_db.create_function("REGEXP", 2, regex_match, deterministic=True)
+    notes_db.create_function("SLUG", 1, kebab_case, deterministic=True)
+
+    configure_db(notes_db, db_path)
+
+    # only initialize the database if it hasn't been done yet
+    schema_version = notes_db.execute("PRAGMA user_version;").fetchone()["user_version"]
+    if schema_version < constants.NOTES_DB_SCHEMA_VERSION:
+        with use_db(notes_db) as (notes_cursor, _):
+            for statement in constants.NOTES_DB_SQL_STATEMENTS:
+                notes_cursor.execute(statement)
+            notes_cursor.execute(f"PRAGMA user_version = {constants.NOTES_DB_SCHEMA_VERSION};")
 
-    notes_db.create_function("REGEXP", 2, regex_match)
-    notes_db.create_function("SLUG", 1, kebab_case)
-    notes_db.executescript(constants.NOTES_DB_SQL_SCHEMA)
     return notes_db
 
 
-@contextmanager
-def use_db(notes_db=None):
+# the opened database connections by their resolved path which are closed at exit
+DB_CONNECTIONS = {}
+
+
+def get_db(db_path=constants.CURRENT_DIRECTORY / constants.PROFILE_DIRECTORY_NAME / constants.NOTES_DB_FILENAME):
     """
-    Simply provides a context manager for using SQLite3 databases for convenience. Usually used with `initialized_db`
-    function. If no database connection was provided, it'll create and use the default connection.
+    Gets the connection of the given database, initializing it only for the first time. This is the preferred way of
+    getting a database connection since the same connection is reused throughout the program runtime.
 
-    :param notes_db: The database connection object to be used. If none was provided, it'll create one with
-                     `initialized_db` function and use that instead.
+    It serves as a connection pool with one connection for each database: the connection is only opened (and
+    configured) once and its prepared statements are kept for the next operations. Since the database is only used
+    from the main thread, there's no need for more than one connection for each database.
+
+    :param db_path: The name (path) of the database.
+    :type db_path: pathlib.Path
+
+    :return: The initialized database connection.
+    :rtype: sqlite3.Connection
+    """
+    db_key = os.path.realpath(db_path)
+    notes_db = DB_CONNECTIONS.get(db_key, None)
+    if notes_db is None:
+        notes_db = initialized_db(db_path)
+        DB_CONNECTIONS[db_key] = notes_db
+
+    return notes_db
+
+
+@atexit.register
+def close_dbs():
+    """
+    Closes all of the database connections opened with `get_db`. The statistics of the databases are updated before
+    closing so the query planner keeps up with the removed subjects and notes.
+
+    :return: Has no return value.
+    :rtype: None
+    """
+    while DB_CONNECTIONS:
+        _, notes_db = DB_CONNECTIONS.popitem()
+
+        # `PRAGMA optimize` only analyzes the tables that need it and the analysis limit bounds its cost
+        # a locked database shouldn't prevent the connection from being closed
+        try:
+            notes_db.execute(f"PRAGMA analysis_limit = {constants.NOTES_DB_ANALYSIS_LIMIT};")
+            notes_db.execute("PRAGMA optimize;")
+        except sqlite3.OperationalError:
+            pass
+
+        notes_db.close()
+
+
+# the filesystem operations to be done once the current transaction of each database connection has been committed
+COMMIT_CALLBACKS = {}
+
+
+def call_after_commit(notes_db, function, *args, **kwargs):
+    """
+    Calls the given function once the current transaction of the database connection has been committed. It is called
+    right away if the connection is not in a transaction. Useful for keeping the filesystem in sync with the database
+    since the filesystem operations (e.g., creating and deleting the files of the notes) cannot be rolled back.
+
+    :param notes_db: The database connection where the transaction is.
+    :type notes_db: sqlite3.Connection
+
+    :param function: The function to be called.
+    :type function: callable
+
+    :return: Has no return value.
+    :rtype: None
+    """
+    if notes_db.in_transaction:
+        COMMIT_CALLBACKS.setdefault(notes_db, []).append((function, args, kwargs))
+    else:
+        function(*args, **kwargs)
+
+
+@contextmanager
+def use_db(notes_db=None, immediate=False):
+    """
+    Simply provides a context manager for using SQLite3 databases for convenience. Usually used with `get_db`
+    function. If no database connection was provided, it'll use the connection of the default database.
+
+    The statements are executed in an explicit transaction which is committed at the end of the context and rolled
+    back if the context has been exited by any exception. If you need to keep the changes before raising an error
+    (e.g., deleting the dangling entries), raise it after the context instead. If the context is nested within
+    another one with the same connection, the transaction is managed by the outermost context instead so you can
+    group several operations in one transaction. The functions given to `call_after_commit` are only called once the
+    transaction has been committed and they are simply discarded if it has been rolled back.
+
+    :param notes_db: The database connection object to be used. If none was provided, it'll get one with
+                     `get_db` function and use that instead.
     :type notes_db: sqlite3.Connection
 
+    :param immediate: Acquires the write lock at the start of the transaction. Useful for transactions that reads
+                      before writing so it won't fail midway with a locked database.
+    :type immediate: bool
+
     :return: Yields a tuple similar to `init_db`
     """
     if notes_db is None:
-        notes_db = initialized_db()
+        notes_db = get_db()
+
+    cursor = notes_db.cursor()
+    owns_transaction = not notes_db.in_transaction
+    if owns_transaction:
+        cursor.execute("BEGIN IMMEDIATE;" if immediate is True else "BEGIN;")
 
     try:
-        cursor = notes_db.cursor()
         yield (cursor, notes_db)
-        cursor.close()
-        notes_db.commit()
-    except sqlite3.DatabaseError as error:
-        notes_db.rollback()
+
+        if owns_transaction:
+            # the callbacks are taken out first so they're not left behind if the commit fails
+            commit_callbacks = COMMIT_CALLBACKS.pop(notes_db, ())
+            if notes_db.in_transaction:
+                notes_db.commit()
+    except BaseException as error:
+        if owns_transaction:
+            COMMIT_CALLBACKS.pop(notes_db, None)
+            if notes_db.in_transaction:
+                notes_db.rollback()
         raise error
+    finally:
+        cursor.close()
+
+    if owns_transaction:
+        for function, args, kwargs in commit_callbacks:
+            function(*args, **kwargs)
 
 
 @contextmanager
 def init_db(db_path=constants.CURRENT_DIRECTORY / constants.PROFILE_DIRECTORY_NAME / constants.NOTES_DB_FILENAME):
     """
-    Context manager for initializing and using a database right away. Take note that the database connection is
-    immediately closed after.
+    Context manager for initializing and using a database right away. The database connection is reused with
+    `get_db` so it stays open until the program exits.
 
     :param db_path: The name (path) of the database.
     :return: A tuple of a database cursor and the database connection.
     :rtype: tuple
     """
-    _notes_db = initialized_db()
-    with use_db(_notes_db) as (notes_cursor, notes_db):
+    with use_db(get_db(db_path)) as (notes_cursor, notes_db):
         yield (notes_cursor, notes_db)
-        notes_db.close()
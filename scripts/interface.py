@@ -1,28 +1,24 @@
-from datetime import date
-from functools import reduce
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from math import ceil
 import logging
-from multiprocessing import cpu_count
-from os import chdir, getcwd
-from os.path import relpath
-from shutil import copy, copytree, rmtree
-from platform import system
-from queue import Queue
-import queue
-import sqlite3
-from string import Template
-from subprocess import run, Popen, PIPE
-from threading import Thread
+from os import cpu_count
+from subprocess import run, DEVNULL
+import sys
 
 # custom packages
 import scripts.constants as constants
 import scripts.exceptions as exceptions
-from .helper import kebab_case, init_db, use_db, regex_match, deduplicate_list
+from .helper import use_db, copy_file, chunk_list, delete_path, delete_paths, get_file_names
 from .manager import *
 
 
+# the handler for printing in the console is set up in `cli` (see `$PROJECT_ROOT/scripts/cli.py`)
+console_logger = logging.getLogger(constants.CONSOLE_LOGGER_NAME)
+
+
 def print_to_console_and_log(msg, logging_level=logging.INFO):
-    logging.log(level=logging_level, msg=msg)
-    print(msg)
+    console_logger.log(logging_level, msg)
 
 
 def add_note(note_metalist=None, subject_metalist=None, force=False, strict=False, **kwargs):
@@ -45,46 +41,58 @@ def add_note(note_metalist=None, subject_metalist=None, force=False, strict=Fals
     """
     metadata = kwargs.get("metadata", None)
 
+    # the subjects and the notes are each added in one transaction instead of one for each of them
+    # the files are only created once the transaction is committed so the subjects are committed first for their
+    # folders to be there when the notes are added
     if subject_metalist is not None:
-        subject_set = reduce(lambda _set, subject_list: _set | set(subject_list), subject_metalist, set())
+        with use_db(metadata["db"], immediate=True):
+            subject_set = set().union(*subject_metalist)
 
-        for subject in subject_set:
-            try:
-                create_subject(subject, metadata=metadata)
+            for subject in subject_set:
+                try:
+                    create_subject(subject, metadata=metadata)
 
-                success_msg = f"Subject '{subject}' added in the binder."
-                print_to_console_and_log(success_msg)
-            except exceptions.SubjectAlreadyExists:
-                print_to_console_and_log(f"Subject '{subject}' already exists.", logging.ERROR)
-            except ValueError:
-                print_to_console_and_log(f"Given subject name '{subject}' is invalid.", logging.ERROR)
-        print()
+                    success_msg = f"Subject '{subject}' added in the binder."
+                    print_to_console_and_log(success_msg)
+                except exceptions.SubjectAlreadyExists:
+                    print_to_console_and_log(f"Subject '{subject}' already exists.", logging.ERROR)
+                except ValueError:
+                    print_to_console_and_log(f"Given subject name '{subject}' is invalid.", logging.ERROR)
+            print()
 
     if note_metalist is not None:
-        for subject_note_list in note_metalist:
-            subject = subject_note_list[0]
-            notes = subject_note_list[1:]
+        with use_db(metadata["db"], immediate=True):
+            for subject_note_list in note_metalist:
+                subject = subject_note_list[0]
+                notes = subject_note_list[1:]
 
-            print_to_console_and_log(f"Creating notes for subject '{subject}':")
+                print_to_console_and_log(f"Creating notes for subject '{subject}':")
 
-            for note in notes:
                 try:
-                    create_subject_note(subject, note, metadata=metadata)
-                    print_to_console_and_log(f"Note '{note}' under subject '{subject}' added in the binder.")
+                    created_notes, existing_notes, invalid_notes = create_subject_notes(subject, *notes,
+                                                                                        force=force,
+                                                                                        metadata=metadata)
                 except exceptions.NoSubjectFoundError:
                     print_to_console_and_log(f"Subject '{subject}' is not found in the binder. Moving on...",
                                              logging.ERROR)
-                    break
+                    print()
+                    continue
                 except exceptions.DanglingSubjectError:
                     print_to_console_and_log(f"Subject '{subject}' is in the binder but its files are missing. " \
                                              f"Deleting the subject entry in the binder.", logging.ERROR)
-                    break
-                except exceptions.SubjectNoteAlreadyExistError:
+                    print()
+                    continue
+
+                for note in created_notes:
+                    print_to_console_and_log(f"Note '{note['title']}' under subject '{subject}' added in the binder.")
+
+                for note in existing_notes:
                     print_to_console_and_log(f"Note with the title '{note}' under subject '{subject}' "
                                              f"already exists in the binder.", logging.ERROR)
-                except ValueError:
+
+                for note in invalid_notes:
                     print_to_console_and_log(f"Note title '{note}' is invalid.", logging.ERROR)
-            print()
+                print()
 
 
 def remove_note(note_metalist=None, subject_metalist=None, delete=False, **kwargs):
@@ -108,65 +116,107 @@ def remove_note(note_metalist=None, subject_metalist=None, delete=False, **kwarg
     if delete:
         print_to_console_and_log("Deleting associated folders/files is enabled.\n")
 
-    if subject_metalist is not None:
-        subject_set = reduce(lambda _set, subject_list: _set | set(subject_list), subject_metalist, set())
+    # the subjects and notes are removed in one transaction instead of one for each of them
+    # their files are only deleted once the transaction is committed
+    with use_db(metadata["db"], immediate=True):
+        if subject_metalist is not None:
+            subject_set = set().union(*subject_metalist)
 
-        if ":all:" in subject_set:
-            remove_all_subjects(delete, metadata=metadata)
-            print_to_console_and_log("All subjects (and its notes) have been removed in the binder.")
-            return
+            if ":all:" in subject_set:
+                remove_all_subjects(delete, metadata=metadata)
+                print_to_console_and_log("All subjects (and its notes) have been removed in the binder.")
+                return
 
-        for subject in subject_set:
-            try:
-                remove_subject(subject, delete, metadata=metadata)
-                print_to_console_and_log(f"Subject '{subject}' has been removed from the binder.")
-            except exceptions.NoSubjectFoundError:
-                print_to_console_and_log(f"Subject '{subject}' doesn't exist in the database.", logging.ERROR)
+            for subject in subject_set:
+                try:
+                    remove_subject(subject, delete, metadata=metadata)
+                    print_to_console_and_log(f"Subject '{subject}' has been removed from the binder.")
+                except exceptions.NoSubjectFoundError:
+                    print_to_console_and_log(f"Subject '{subject}' doesn't exist in the database.", logging.ERROR)
 
-        print()
+            print()
 
-    if note_metalist is not None:
-        for subject_note_list in note_metalist:
-            subject = subject_note_list[0]
-            notes = subject_note_list[1:]
+        if note_metalist is not None:
+            for subject_note_list in note_metalist:
+                subject = subject_note_list[0]
+                notes = subject_note_list[1:]
 
-            print_to_console_and_log(f"Removing notes under subject '{subject}':")
+                print_to_console_and_log(f"Removing notes under subject '{subject}':")
 
-            if ":all:" in notes:
-                try:
-                    remove_all_subject_notes(subject, delete, metadata=metadata)
-                    print_to_console_and_log(f"All notes under '{subject}' have been removed from the binder.")
-                except exceptions.NoSubjectFoundError:
-                    print_to_console_and_log(f"Subject '{subject}' is not found in the database. Moving on...",
-                                             logging.ERROR)
-                except exceptions.DanglingSubjectError:
-                    print_to_console_and_log(f"Subject '{subject}' is not found in the filesystem. Moving on...",
-                                             logging.ERROR)
-            else:
-                for note in notes:
+                if ":all:" in notes:
+                    try:
+                        remove_all_subject_notes(subject, delete, metadata=metadata)
+                        print_to_console_and_log(f"All notes under '{subject}' have been removed from the binder.")
+                    except exceptions.NoSubjectFoundError:
+                        print_to_console_and_log(f"Subject '{subject}' is not found in the database. Moving on...",
+                                                 logging.ERROR)
+                    except exceptions.DanglingSubjectError:
+                        print_to_console_and_log(f"Subject '{subject}' is not found in the filesystem. Moving on...",
+                                                 logging.ERROR)
+                else:
                     try:
-                        remove_subject_note(subject, note, delete_on_disk=delete, metadata=metadata)
-                        print_to_console_and_log(f"Note '{note}' under subject '{subject}' has been removed from the"
-                                                 f"binder.")
+                        removed_notes, missing_notes, dangling_notes = remove_subject_notes(subject, *notes,
+                                                                                            delete_on_disk=delete,
+                                                                                            metadata=metadata)
                     except exceptions.NoSubjectFoundError:
                         print_to_console_and_log(f"Subject '{subject}' is not found in the database. Moving on...",
                                                  logging.ERROR)
-                        break
+                        print()
+                        continue
                     except exceptions.DanglingSubjectError:
                         print_to_console_and_log(f"Subject '{subject}' is not found in the filesytem. Moving on...",
                                                  logging.ERROR)
-                        break
-                    except exceptions.NoSubjectNoteFoundError:
+                        print()
+                        continue
+
+                    for note in removed_notes:
+                        print_to_console_and_log(f"Note '{note['title']}' under subject '{subject}' has been removed "
+                                                 f"from the binder.")
+
+                    for note in missing_notes:
                         print_to_console_and_log(f"Note with the title '{note}' under subject '{subject}' "
                                                  f"does not exist in the binder.", logging.ERROR)
-                    except exceptions.DanglingSubjectNoteFoundError:
-                        print_to_console_and_log(f"Note with the title '{note}' under subject '{subject}' has its"
-                                                 f"file missing. Deleting it in the binder.", logging.ERROR)
-            print()
+
+                    for note in dangling_notes:
+                        print_to_console_and_log(f"Note with the title '{note['title']}' under subject '{subject}' "
+                                                 f"has its file missing. Deleting it in the binder.", logging.ERROR)
+                print()
 
     return 0
 
 
+def parse_notes(notes, exclude=()):
+    """
+    Separates the keywords from the note titles in a single pass.
+
+    :param notes: A list of note titles which may include the keywords ":main:" and ":all:".
+    :type notes: list[str]
+
+    :param exclude: The note titles to be left out of the result.
+    :type exclude: set[str]
+
+    :return: A tuple made up of three items: a boolean if ":main:" is given, a boolean if ":all:" is given, and a
+             deduplicated list of the rest of the (stripped) note titles in the order they were given.
+    :rtype: tuple
+    """
+    main = False
+    all_notes = False
+    seen_notes = set(exclude)
+    unique_notes = []
+
+    for note in notes:
+        title = note.strip()
+        if title == ":main:":
+            main = True
+        elif title == ":all:":
+            all_notes = True
+        elif title not in seen_notes:
+            seen_notes.add(title)
+            unique_notes.append(title)
+
+    return main, all_notes, unique_notes
+
+
 # this serves as an environment for note compilation
 class TempCompilingDirectory:
     def __init__(self, metadata=None):
@@ -179,17 +229,23 @@ class TempCompilingDirectory:
         """
         # copy every main files to be copied in the temp dir
         self.metadata = metadata
-        self.output_directory = metadata["profile"] / ".output"
+        # the output directory is only resolved once since the output directories of the subjects are under it
+        self.output_directory = metadata["profile"] / constants.OUTPUT_DIRECTORY_NAME
 
         self.output_directory.mkdir(exist_ok=True)
 
-        self.subjects = []
+        # the added subjects keyed by their given name
+        # the same subject can be added multiple times so the subject is only retrieved once
+        self.subjects = {}
 
     def add_subject(self, subject, *notes):
         """
         Adds a subject to be noted within the compilation environment by adding it into the internal subject list and
         copy the appropriate directory into the temporary folder. It also adds an additional
 
+        If the subject has already been added, the given notes are simply merged with the notes of the added subject
+        without retrieving the subject again.
+
         :param subject: The subject to be added. Take note that the subject data should contain the results from the
                         `get_subject()` function.
         :type subject: dict
@@ -200,31 +256,42 @@ class TempCompilingDirectory:
         :return: It's a void function.
         :rtype: None
         """
-        try:
-            subject = get_subject(subject, delete_in_db=True, metadata=self.metadata)
-        except (exceptions.NoSubjectFoundError, exceptions.DanglingSubjectError) as error:
-            raise error
-
-        notes = deduplicate_list(notes)
-        try:
-            notes.remove(":main:")
-            main = True
-        except ValueError:
-            main = False
+        subject_name = subject
+        subject = self.subjects.get(subject_name, None)
+        if subject is None:
+            subject = get_subject(subject_name, delete_in_db=True, metadata=self.metadata)
 
-        if ":all:" in notes:
-            notes_query = get_all_subject_notes(subject["name"], metadata=self.metadata)[0]
-        else:
+            subject["notes"] = []
+            subject["main"] = False
+            subject["all_notes"] = False
+            self.subjects[subject_name] = subject
+
+        # only the notes that are not yet added are retrieved
+        added_note_titles = {note["title"] for note in subject["notes"]}
+        main, all_notes, notes = parse_notes(notes, exclude=added_note_titles)
+
+        if subject["all_notes"] or (len(notes) == 0 and not all_notes):
             notes_query = []
-            for note in notes:
-                notes_query.append(get_subject_note(subject["name"], note))
+        elif all_notes:
+            notes_query = find_all_subject_notes(subject, metadata=self.metadata)[0]
+            notes_query = [note for note in notes_query if note["title"] not in added_note_titles]
+        else:
+            notes_query, missing_notes, dangling_notes = find_subject_notes(subject, *notes, metadata=self.metadata)
+
+            for note in missing_notes:
+                print_to_console_and_log(f"Note with the title '{note}' under subject '{subject['name']}' "
+                                         f"does not exist in the binder.", logging.ERROR)
 
-        if main is True:
+            for note in dangling_notes:
+                print_to_console_and_log(f"Note with the title '{note['title']}' under subject '{subject['name']}' "
+                                         f"has its file missing. Deleting it in the binder.", logging.ERROR)
+
+        if main is True and subject["main"] is False:
             create_main_note(subject["name"], metadata=self.metadata)
 
-        subject["notes"] = notes_query
-        subject["main"] = main
-        self.subjects.append(subject)
+        subject["notes"].extend(notes_query)
+        subject["main"] = subject["main"] or main
+        subject["all_notes"] = subject["all_notes"] or all_notes
 
     def compile_notes(self, output_directory=None):
         """
@@ -236,125 +303,197 @@ class TempCompilingDirectory:
         :return: Has no return value
         :rtype: None
         """
-        owd = getcwd()
-        for subject in self.subjects:
+        for subject in self.subjects.values():
             subject_output_directory = self.output_directory / subject['slug']
 
             print_to_console_and_log(f"Compiling notes under '{subject['name']}'. " \
-                f"Output location is at {subject_output_directory.resolve()}.")
+                f"Output location is at {subject_output_directory}.")
 
-            subject_note_compile_queue = Queue()
+            # the whole output of the subject is going to be replaced when all of the notes are compiled so it is
+            # simply removed in one go instead of removing the stale files of each note
+            # the output of the main note is kept if it is not compiled again
+            if subject["all_notes"]:
+                self._reset_subject_output(subject_output_directory, keep_main=not subject["main"])
+            subject_output_directory.mkdir(parents=True, exist_ok=True)
 
             if subject["main"]:
-                chdir(subject["path"].resolve())
-                latex_compilation_process = Popen(["latexmk", constants.MAIN_SUBJECT_TEX_FILENAME, "-shell-escape",
-                                                   "-pdf"], stdin=PIPE, stdout=PIPE, stderr=PIPE)
-                latex_cleanup_process = Popen(["latexmk", "-c", constants.MAIN_SUBJECT_TEX_FILENAME], stdin=PIPE, stdout=PIPE, stderr=PIPE)
-                latex_compilation_process.communicate()
-                latex_cleanup_process.communicate()
-                chdir(owd)
-                if latex_compilation_process.returncode is not 0:
-                    print_to_console_and_log(f"Main note of subject '{subject['name']}' has failed to compile.")
-                    copy(subject["path"] / "main.log", subject_output_directory)
-                else:
+                latex_compilation_process = run(["latexmk", constants.MAIN_SUBJECT_TEX_FILENAME, "-shell-escape",
+                                                 "-pdf"], cwd=subject["path"], stdin=DEVNULL, stdout=DEVNULL,
+                                                stderr=DEVNULL)
+                if latex_compilation_process.returncode == 0:
                     print_to_console_and_log(f"Main note of subject '{subject['name']}' has been compiled")
-                    copy(subject["path"] / "main.pdf", subject_output_directory)
+                    main_output_filename = constants.MAIN_SUBJECT_TEX_FILENAME + ".pdf"
+                else:
+                    print_to_console_and_log(f"Main note of subject '{subject['name']}' has failed to compile.")
+                    main_output_filename = constants.MAIN_SUBJECT_TEX_FILENAME + ".log"
+
+                copy_file(subject["path"] / main_output_filename, subject_output_directory / main_output_filename)
+
+            # the notes are split evenly between the workers and each batch is compiled with one latexmk process
+            # the compilation processes are started by the workers so there are only as many running compilations
+            # as there are workers
+            # the notes of the failed batches are compiled on their own with the same workers
+            available_threads = cpu_count() or 1
+            batch_size = max(1, ceil(len(subject["notes"]) / available_threads))
+            with ThreadPoolExecutor(max_workers=available_threads) as executor:
+                uncompiled_notes = [note for batch_result in executor.map(self._compile_note_batch, repeat(subject),
+                                                                          chunk_list(subject["notes"], batch_size),
+                                                                          repeat(subject_output_directory))
+                                    for note in batch_result]
+                list(executor.map(self._compile_note, repeat(subject), uncompiled_notes,
+                                  repeat(subject_output_directory)))
+
+            self._cleanup_subject(subject)
+            print()
+
+    def _reset_subject_output(self, subject_output_directory, keep_main=False):
+        """
+        Removes the output directory of a subject along with its contents.
+
+        :param subject_output_directory: The output directory of the subject.
+        :type subject_output_directory: Path
+
+        :param keep_main: Keeps the output of the main note (e.g., when it is not compiled again) and only removes
+                          the rest of the files.
+        :type keep_main: bool
+
+        :return: Has no return value.
+        :rtype: None
+        """
+        if keep_main is False:
+            delete_path(subject_output_directory, directory=True)
+            return
 
-            chdir(subject["path"].resolve())
+        main_output_filenames = {constants.MAIN_SUBJECT_TEX_FILENAME + ".pdf",
+                                 constants.MAIN_SUBJECT_TEX_FILENAME + ".log"}
+        delete_paths([subject_output_directory / filename for filename in get_file_names(subject_output_directory)
+                      if filename not in main_output_filenames])
 
-            for note in subject["notes"]:
-                latex_compilation_processes = Popen(["latexmk", note["path"].name, "-shell-escape", "-pdf"],
-                                                     stdin=PIPE, stdout=PIPE, stderr=PIPE)
+    def _cleanup_subject(self, subject):
+        """
+        Removes the auxiliary files of the compiled notes of a subject with a single `latexmk -c` invocation.
 
-                subject_note_compile_queue.put((latex_compilation_processes, note))
+        :param subject: The compiled subject.
+        :type subject: dict
 
-            available_threads = cpu_count()
+        :return: Has no return value.
+        :rtype: None
+        """
+        compiled_files = [note["path"].name for note in subject["notes"]]
+        if subject["main"]:
+            compiled_files.append(constants.MAIN_SUBJECT_TEX_FILENAME)
 
-            for _thread in range(0, available_threads):
-                thread = Thread(target=self._compile, args=(subject, subject_note_compile_queue, output_directory, owd))
-                thread.daemon = True
-                thread.start()
+        if len(compiled_files) == 0:
+            return
 
-            subject_note_compile_queue.join()
+        compile_cleanup_command = run(["latexmk", "-c", *compiled_files], cwd=subject["path"],
+                                      stdin=DEVNULL, stdout=DEVNULL, stderr=DEVNULL)
+        if compile_cleanup_command.returncode != 0:
+            compile_cleanup_msg = f"Cleanup of the notes under '{subject['name']}' has failed. Please delete the " \
+                f"files manually (or try the command \"latexmk -c\" in {subject['path']} again.)"
+        else:
+            compile_cleanup_msg = f"Cleanup of the notes under '{subject['name']}' has been successful."
 
-            print()
+        print_to_console_and_log(compile_cleanup_msg)
 
-    def _compile(self, subject, subject_note_compile_queue, output_directory, original_working_directory):
+    def _compile_note_batch(self, subject, notes, subject_output_directory):
         """
-        Continuously compile notes from a subject notes task queue where it contains both the note information and the
-        compile command to be executed. Once the task queue is empty, that's where it will break out.
+        Compiles a batch of notes with a single latexmk process. Since there's no telling which of the notes has
+        failed (a partial PDF may still be produced from a note with errors), all of the notes of a failed batch are
+        returned to be compiled on their own. The notes that have already been compiled are simply skipped by latexmk
+        anyway.
 
-        :param subject: The subject of the note to be compiled.
+        :param subject: The subject of the notes to be compiled.
         :type subject: dict
 
-        :param subject_note_compile_queue: The task queue.
-        :type subject_note_compile_queue: Queue
+        :param notes: The notes to be compiled.
+        :type notes: list[dict]
 
-        :param output_directory: The output directory where the compiled file(s) will be sent.
-        :type output_directory: Path
+        :param subject_output_directory: The output directory of the subject. It should already exist by then.
+        :type subject_output_directory: Path
+
+        :return: The notes to be compiled on their own.
+        :rtype: list[dict]
+        """
+        if len(notes) == 1:
+            self._compile_note(subject, notes[0], subject_output_directory)
+            return []
+
+        for note in notes:
+            logging.info(f"Compilation process of note '{note['title']}' has started...")
+        latex_compilation_process = run(["latexmk", "-shell-escape", "-pdf", *(note["path"].name for note in notes)],
+                                        cwd=subject["path"], stdin=DEVNULL, stdout=DEVNULL, stderr=DEVNULL)
+
+        if latex_compilation_process.returncode != 0:
+            return notes
+
+        for note in notes:
+            self._send_note_output(subject, note, subject_output_directory, True)
+
+        return []
+
+    def _compile_note(self, subject, note, subject_output_directory):
+        """
+        Compiles a single note and sends the resulting PDF (or the log if it failed) into the output directory of
+        the subject.
+
+        :param subject: The subject of the note to be compiled.
+        :type subject: dict
+
+        :param note: The note to be compiled.
+        :type note: dict
 
-        :param original_working_directory: The original working directory of the process. This is needed in order to
-                                           copy the files correctly.
-        :type original_working_directory: Path
+        :param subject_output_directory: The output directory of the subject. It should already exist by then.
+        :type subject_output_directory: Path
 
         :return: Has no return value.
         :rtype: None
         """
-        while True:
-            try:
-                command_metadata = subject_note_compile_queue.get()
-            except queue.Empty:
-                break
-
-            latex_compilation_process = command_metadata[0]
-            note = command_metadata[1]
+        logging.info(f"Compilation process of note '{note['title']}' has started...")
+        # the output of latexmk is discarded since the log file of the note is kept instead when it fails
+        latex_compilation_process = run(["latexmk", note["path"].name, "-shell-escape", "-pdf"],
+                                        cwd=subject["path"], stdin=DEVNULL, stdout=DEVNULL, stderr=DEVNULL)
 
-            logging.info(f"Compilation process of note '{note['title']}' has started...")
-            latex_compilation_process.communicate()
+        self._send_note_output(subject, note, subject_output_directory, latex_compilation_process.returncode == 0)
 
-            compile_cleanup_command = Popen(["latexmk", "-c" , f"{note['path'].name}"], stdin=PIPE, stdout=PIPE, stderr=PIPE)
-            compile_cleanup_command.communicate()
-            if compile_cleanup_command.returncode is not 0:
-                compile_cleanup_msg = f"Cleanup of '{note['path'].name}' has failed. Please delete it manually (or try the command \"latexmk -c {note['path'].name}\" again.)"
-            else:
-                compile_cleanup_msg = f"Cleanup of '{note['path'].name}' has been successful."
+    def _send_note_output(self, subject, note, subject_output_directory, compiled):
+        """
+        Sends the resulting PDF of a compiled note (or its log if it failed) into the output directory of the subject.
 
-            logging.info(compile_cleanup_msg)
-            print(compile_cleanup_msg)
+        :param subject: The subject of the compiled note.
+        :type subject: dict
 
-            chdir(original_working_directory)
-            note_output_filepath = self.output_directory / subject["path"].stem
-            note_output_filepath.mkdir(exist_ok=True)
+        :param note: The compiled note.
+        :type note: dict
 
-            subject_note_log_filename = note['path'].stem + ".log"
-            subject_note_log = subject["path"] / subject_note_log_filename
+        :param subject_output_directory: The output directory of the subject.
+        :type subject_output_directory: Path
 
-            compiled_pdf_filename = note['path'].stem + ".pdf"
-            compiled_pdf = subject["path"] / compiled_pdf_filename
+        :param compiled: Indicates if the note has been compiled successfully.
+        :type compiled: bool
 
-            if latex_compilation_process.returncode is not 0:
-                logging.error(f"Compilation process of note '{note['title']}' has failed. No PDF has been produced.")
-                print(f"Note '{note['title']}' not being able to compile. Check the resulting log for errors.")
-                compiled_pdf_output = note_output_filepath / compiled_pdf_filename
-                if compiled_pdf_output.exists():
-                    compiled_pdf_output.unlink()
+        :return: Has no return value.
+        :rtype: None
+        """
+        subject_note_log_filename = note["path"].with_suffix(".log").name
+        compiled_pdf_filename = note["path"].with_suffix(".pdf").name
 
-                copy(subject_note_log, note_output_filepath)
-                subject_note_compile_queue.task_done()
-                continue
+        # take note the cleanup of the subject also removes the log so it has to be copied by then
+        if compiled is False:
+            print_to_console_and_log(f"Note '{note['title']}' not being able to compile. No PDF has been produced. "
+                                     f"Check the resulting log for errors.", logging.ERROR)
+            if not subject["all_notes"]:
+                delete_path(subject_output_directory / compiled_pdf_filename)
 
+            copy_file(subject["path"] / subject_note_log_filename, subject_output_directory / subject_note_log_filename)
+        else:
             compile_success_msg = f"Successfully compiled note '{note['title']}' into PDF."
-            logging.info(compile_success_msg)
-            print(compile_success_msg)
-            
-            subject_note_output_log = note_output_filepath / subject_note_log_filename
-            if subject_note_output_log.exists():
-                subject_note_output_log.unlink()
+            print_to_console_and_log(compile_success_msg)
 
-            copy(compiled_pdf, note_output_filepath)
+            if not subject["all_notes"]:
+                delete_path(subject_output_directory / subject_note_log_filename)
 
-            subject_note_compile_queue.task_done()
-            continue
+            copy_file(subject["path"] / compiled_pdf_filename, subject_output_directory / compiled_pdf_filename)
 
 
 def compile_note(note_metalist, cache=False, **kwargs):
@@ -384,14 +523,7 @@ def list_note(subjects, **kwargs):
     if ":all:" in subjects:
         subjects_query = get_all_subjects(sort_by="name", metadata=profile_metadata)[0]
     else:
-        subjects_query = []
-        for subject in subjects:
-            subject_query = get_subject(subject, metadata=profile_metadata)
-
-            if subject_query is None:
-                continue
-
-            subjects_query.append(subject_query)
+        subjects_query = get_subjects(*subjects, metadata=profile_metadata)[0]
 
     if len(subjects_query) == 0:
         print_to_console_and_log("There's no subjects listed in the database.")
@@ -399,16 +531,17 @@ def list_note(subjects, **kwargs):
 
     sort_by = kwargs.get("sort", "title")
     for subject in subjects_query:
-        subject_notes_query = get_all_subject_notes(subject["name"], sort_by=sort_by, metadata=profile_metadata)[0]
+        # the subjects are already retrieved so they are not searched again for their notes
+        subject_notes_query = find_all_subject_notes(subject, sort_by=sort_by, metadata=profile_metadata)[0]
         note_count = len(subject_notes_query)
 
         print_to_console_and_log(f"Subject \"{subject['name']}\" has "
                                  f"{note_count} {'notes' if note_count > 1 else 'note'}.")
 
-        for note in subject_notes_query:
-            logging.info(f"Subject '{subject['name']}': {note['title']}")
-            print(f"  - ({note['id']}) {note['title']}")
-        print()
+        # the list of notes is written all at once instead of one line for each note
+        if note_count > 0 and logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info("\n".join(f"Subject '{subject['name']}': {note['title']}" for note in subject_notes_query))
+        sys.stdout.write("".join(f"  - ({note['id']}) {note['title']}\n" for note in subject_notes_query) + "\n")
     exit(0)
 
 
@@ -432,7 +565,7 @@ def open_note(note, **kwargs):
     except exceptions.NoSubjectFoundError as error:
         print("No subject ")
 
-    note_absolute_filepath = note_query["path"].absolute().__str__()
+    note_absolute_filepath = str(note_query["path"])
 
     execute_cmd = kwargs.pop("execute", None)
     if execute_cmd is not None:
@@ -440,7 +573,7 @@ def open_note(note, **kwargs):
     else:
         note_editor_instance = run([constants.config["DEFAULT_NOTE_EDITOR"], note_absolute_filepath])
 
-    if note_editor_instance.returncode is True:
+    if note_editor_instance.returncode == 0:
         logging.info("Text editor has been opened.")
         exit(0)
     else:
@@ -1,21 +1,17 @@
 # native packages
 from datetime import date
-from functools import reduce
-import logging
-from multiprocessing import cpu_count
-from os import chdir, getcwd
+import os
 from os.path import relpath
-from shutil import copy, copytree, rmtree
 from pathlib import Path
-from platform import system
 import sqlite3
 from string import Template
-from subprocess import run
 
 # custom packages
 import scripts.constants as constants
 import scripts.exceptions as exceptions
-from .helper import kebab_case, initialized_db, use_db, regex_match, deduplicate_list
+from .helper import kebab_case, get_db, use_db, deduplicate_list, chunk_list, sql_parameter_list, \
+    get_directory_names, get_file_names, cached_is_dir, cached_is_file, clear_path_caches, SUBJECT_NAME_PATTERN, \
+    NUMERIC_NAME_PATTERN, SQLITE_SUPPORTS_RETURNING, delete_paths, call_after_commit
 
 """
 All of the note functions accepts a metalist of notes with the subject as the first item in each
@@ -32,10 +28,14 @@ Example:
 
 """
 
+# The statements for deleting a subject or a note by their ID. Take note that the statements are used for both
+# single and batched deletions so there's only one prepared statement for each in the statement cache.
+DELETE_SUBJECT_SQL_STATEMENT = "DELETE FROM subjects WHERE id == ?;"
+DELETE_NOTE_SQL_STATEMENT = "DELETE FROM notes WHERE id == ?;"
+
 
 def create_symbolic_link(_link, _target, filename):
-    """Simply creates a relative symbolic link through the shell. Cross-platform support is down to a minimum
-    so expect some bugs to pop up often.
+    """Simply creates a relative symbolic link. An existing file in the link location is left as it is.
 
     :param _link: The path to be linked.
     :type _link: Path
@@ -43,26 +43,24 @@ def create_symbolic_link(_link, _target, filename):
     :param _target: The target or the destination of the symbolic link to be created.
     :type _target: Path
 
-    :return: The results from a `subprocess.run` invocation. For more information, visit the following page
-             (https://docs.python.org/3/library/subprocess.html#subprocess.run).
+    :param filename: The filename of the symbolic link.
+    :type filename: str
+
+    :return: The path of the symbolic link.
+    :rtype: Path
     """
-    os_platform = system()
-    symbolic_link_creation_process = None
-    link = relpath(_link, _target)
-    target = _target
+    symbolic_link_path = Path(_target) / filename
 
-    if os_platform == "Windows":
-        symbolic_link_creation_process = run(["ln", "--symbolic", link, target / filename])
-    elif os_platform == "Linux":
-        symbolic_link_creation_process = run(["ln", "--symbolic", link, target / filename])
-    else:
-        symbolic_link_creation_process = run(["ln", "--symbolic", link, filename])
+    try:
+        os.symlink(relpath(_link, _target), symbolic_link_path, target_is_directory=False)
+    except FileExistsError:
+        pass
 
-    return symbolic_link_creation_process
+    return symbolic_link_path
 
 
+# take note that the rows from the database are already dictionaries so they are simply extended
 def convert_subject_query_to_dictionary(subject_query, metadata=None):
-        subject_query = dict(subject_query)
         subject_query["slug"] = kebab_case(subject_query["name"])
         subject_query["path"] = metadata["notes"] / subject_query["slug"]
         return subject_query
@@ -75,13 +73,14 @@ def get_profile(location=constants.CURRENT_DIRECTORY):
     :param location:
     :return:
     """
-    location_path = Path(location)
+    # the paths of the profile are absolute so they don't depend on the current working directory
+    location_path = Path(location).resolve()
     profile = location_path / constants.PROFILE_DIRECTORY_NAME
     if profile.exists() is False:
         raise exceptions.ProfileDoesNotExistsError(location)
 
     notes = profile / constants.NOTES_DIRECTORY_NAME
-    db = initialized_db(notes / constants.NOTES_DB_FILENAME)
+    db = get_db(notes / constants.NOTES_DB_FILENAME)
 
     return {
         "profile": profile,
@@ -100,7 +99,7 @@ def create_profile(location=constants.CURRENT_DIRECTORY):
 
     :return: dict
     """
-    location_path = Path(location)
+    location_path = Path(location).resolve()
     profile = location_path / constants.PROFILE_DIRECTORY_NAME
     if profile.exists() is True or profile.is_symlink() is True:
         raise exceptions.ProfileAlreadyExistsError(location)
@@ -118,7 +117,7 @@ def create_profile(location=constants.CURRENT_DIRECTORY):
     notes = profile / constants.NOTES_DIRECTORY_NAME
     notes.mkdir()
 
-    notes_db = initialized_db(notes / constants.NOTES_DB_FILENAME)
+    notes_db = get_db(notes / constants.NOTES_DB_FILENAME)
 
     return {
         "profile": profile,
@@ -161,13 +160,15 @@ def get_subject(subject, delete_in_db=True, metadata=None):
 
         subject_value = convert_subject_query_to_dictionary(subject_query, metadata=metadata)
 
-        if subject_value["path"].is_dir() is False:
-            if delete_in_db is True:
-                notes_cursor.execute("DELETE FROM subjects WHERE id == :subject_id;", {"subject_id": subject_query["id"]})
-                notes_db.commit()
-            raise exceptions.DanglingSubjectError(subject_value)
+        is_dangling = cached_is_dir(str(subject_value["path"])) is False
+        if is_dangling and delete_in_db is True:
+            notes_cursor.execute(DELETE_SUBJECT_SQL_STATEMENT, (subject_query["id"],))
+
+    # the error is only raised after the transaction so the deletion of the dangling subject is committed
+    if is_dangling:
+        raise exceptions.DanglingSubjectError(subject_value)
 
-        return subject_value
+    return subject_value
 
 
 def get_subject_by_id(id, delete_in_db=True, metadata=None):
@@ -180,18 +181,20 @@ def get_subject_by_id(id, delete_in_db=True, metadata=None):
             raise exceptions.NoSubjectFoundError(id)
         
         subject_query = convert_subject_query_to_dictionary(subject_query, metadata=metadata)
-        
-        if subject_query["path"].is_dir() is False:
-            if delete_in_db is True:
-                notes_cursor.execute("DELETE FROM subjects WHERE id == :subject_id;", {"subject_id": subject_query["id"]})
-                notes_db.commit()
-            raise exceptions.DanglingSubjectError(subject_query["name"])
-        
-        return subject_query
+
+        is_dangling = cached_is_dir(str(subject_query["path"])) is False
+        if is_dangling and delete_in_db is True:
+            notes_cursor.execute(DELETE_SUBJECT_SQL_STATEMENT, (subject_query["id"],))
+
+    # similar to `get_subject`, the error is only raised after the deletion is committed
+    if is_dangling:
+        raise exceptions.DanglingSubjectError(subject_query["name"])
+
+    return subject_query
 
 
 def convert_note_query_to_dictionary(note_query, subject_query):
-    note = dict(note_query)
+    note = note_query
     note["subject"] = subject_query["name"]
     note["slug"] = kebab_case(note["title"])
     note["path"] = subject_query["path"] / (note["slug"] + ".tex")
@@ -228,46 +231,46 @@ def get_subjects(*subjects, **kwargs):
         # this will eventually be the list for subjects that are not found
         subjects_set = deduplicate_list(subjects)
 
-        subject_set_valid_sql_string = "(" + ", ".join(str(f"'{subject}'") for subject in subjects_set) + ")"
-        notes_cursor.execute(f"SELECT id, name, datetime_modified FROM subjects WHERE name "
-                             f"IN {subject_set_valid_sql_string};")
-
-        subjects_query = notes_cursor.fetchall()
+        # the subjects are searched in batches of `IN (...)` queries instead of one query for each subject
+        subjects_query = []
+        for subjects_chunk in chunk_list(subjects_set, constants.NOTES_DB_MAX_QUERY_VARIABLES):
+            placeholders, parameters = sql_parameter_list(subjects_chunk)
+            notes_cursor.execute(f"SELECT id, name, datetime_modified FROM subjects WHERE name IN ({placeholders});",
+                                 parameters)
+            subjects_query.extend(notes_cursor.fetchall())
 
         # getting the valid keyword arguments handling for this function
         strict = kwargs.pop("strict", False)
         delete_in_db = kwargs.pop("delete_in_db", True)
 
-        # this list will first receive the index of the dangling notes before the note dictionaries
+        found_subjects = []
         dangling_subjects = []
 
-        for (index, subject) in enumerate(subjects_query):
-            subject = convert_subject_query_to_dictionary(subject, metadata=profile_metadata)
-            subjects_query[index] = subject
+        # the notes directory is only scanned once instead of checking each subject directory
+        subject_directories = get_directory_names(profile_metadata["notes"])
 
-            # remove the subjects that are found in the set
-            # the remaining subject names are the one that is not found in the database
-            try:
-                subject_index = subjects_set.index(subject["name"])
-                subjects_set.pop(subject_index)
-            except ValueError:
-                continue
+        for _subject in subjects_query:
+            subject = convert_subject_query_to_dictionary(_subject, metadata=profile_metadata)
 
-            if subject["path"].is_dir() is False:
-                dangling_subjects.append(index)
+            if subject["slug"] not in subject_directories:
+                dangling_subjects.append(subject)
+            else:
+                found_subjects.append(subject)
 
-                if delete_in_db is True:
-                    notes_cursor.execute("DELETE FROM subjects WHERE id == :subject_id;", {"subject_id": subject["id"]})
-                    notes_db.commit()
-                continue
+        # the dangling subjects are deleted all at once
+        if delete_in_db is True and len(dangling_subjects) > 0:
+            notes_cursor.executemany(DELETE_SUBJECT_SQL_STATEMENT,
+                                     [(subject["id"],) for subject in dangling_subjects])
 
-        dangling_subjects[:] = [subjects_query.pop(index) for index in dangling_subjects]
+    # the remaining subject names are the one that is not found in the database
+    found_subject_names = {subject["name"] for subject in subjects_query}
+    subjects_set = [subject for subject in subjects_set if subject not in found_subject_names]
 
-        if (len(subjects_set) > 0 or len(dangling_subjects) > 0) or len(subjects_query) > 0:
-            if strict is True:
-                raise exceptions.MultipleSubjectError(subjects_set, dangling_subjects)
+    # the error is only raised after the transaction so the deletion of the dangling subjects is committed
+    if (len(subjects_set) > 0 or len(dangling_subjects) > 0) and strict is True:
+        raise exceptions.MultipleSubjectError(subjects_set, dangling_subjects)
 
-        return subjects_query, subjects_set, dangling_subjects
+    return found_subjects, subjects_set, dangling_subjects
 
 
 def get_all_subjects(sort_by=None, strict=False, delete_in_db=True, metadata=None):
@@ -307,30 +310,30 @@ def get_all_subjects(sort_by=None, strict=False, delete_in_db=True, metadata=Non
 
         notes_cursor.execute(select_all_notes_sql_statement)
 
-        # take note that this list will receive list indices before the metadata
+        subjects_query = []
         dangled_subjects = []
 
-        subjects_query = notes_cursor.fetchall()
-        for (index, _subject) in enumerate(subjects_query):
-            subject = convert_subject_query_to_dictionary(_subject, metadata=metadata)
-            subjects_query[index] = subject
+        # the notes directory is only scanned once instead of checking each subject directory
+        subject_directories = get_directory_names(metadata["notes"])
 
-            if subject["path"].is_dir() is False:
-                dangled_subjects.append(index)
+        for _subject in notes_cursor.fetchall():
+            subject = convert_subject_query_to_dictionary(_subject, metadata=metadata)
 
-                if delete_in_db is True:
-                    notes_cursor.execute("DELETE FROM subjects WHERE id == :subject_id;",
-                                        {"subject_id": subject["id"]})
-                    notes_db.commit()
-                continue
+            if subject["slug"] not in subject_directories:
+                dangled_subjects.append(subject)
+            else:
+                subjects_query.append(subject)
 
-        # putting all of the dangling subjects in the array
-        dangled_subjects[:] = [subjects_query.pop(index) for index in dangled_subjects]
+        # the dangling subjects are deleted all at once
+        if delete_in_db is True and len(dangled_subjects) > 0:
+            notes_cursor.executemany(DELETE_SUBJECT_SQL_STATEMENT,
+                                     [(subject["id"],) for subject in dangled_subjects])
 
-        if len(dangled_subjects) > 0 and strict is True:
-            raise exceptions.DanglingSubjectError(dangled_subjects)
+    # the error is only raised after the transaction so the deletion of the dangling subjects is committed
+    if len(dangled_subjects) > 0 and strict is True:
+        raise exceptions.DanglingSubjectError(dangled_subjects)
 
-        return subjects_query, dangled_subjects
+    return subjects_query, dangled_subjects
 
 
 def get_subject_note(subject, note, delete_in_db=True, metadata=None):
@@ -361,32 +364,171 @@ def get_subject_note(subject, note, delete_in_db=True, metadata=None):
     :raises NoSubjectNoteFoundError: When the subject note is not found in the database.
     :raises DanglingSubjectNoteError: When the subject is found in the database but the corresponding file is missing.
     """
-    try:
-        subject_query = get_subject(subject, delete_in_db=delete_in_db, metadata=metadata)
-    except (exceptions.NoSubjectFoundError, exceptions.DanglingSubjectError) as error:
-        raise error
-
     with use_db(metadata["db"]) as (notes_cursor, notes_db):
         note = note.strip()
 
-        note_query_arguments = {"subject_id": subject_query["id"], "title": note}
-        
-        notes_cursor.execute("SELECT id, subject_id, title, datetime_modified FROM notes WHERE "
-                            "subject_id == :subject_id AND title == :title;", note_query_arguments)
+        # the subject and the note are retrieved together
+        notes_cursor.execute("SELECT notes.id, notes.subject_id, notes.title, notes.datetime_modified, "
+                             "subjects.name AS subject_name, "
+                             "subjects.datetime_modified AS subject_datetime_modified "
+                             "FROM notes JOIN subjects ON subjects.id == notes.subject_id "
+                             "WHERE subjects.name == :subject AND notes.title == :title;",
+                             {"subject": subject, "title": note})
         note_query = notes_cursor.fetchone()
 
-        if note_query is None:
-            raise exceptions.NoSubjectNoteFoundError(subject, [note])
+        # the errors are only raised after the transaction so the deletion of the dangling entries is committed
+        dangling_error = None
+        if note_query is not None:
+            subject_query = convert_subject_query_to_dictionary({
+                "id": note_query["subject_id"],
+                "name": note_query.pop("subject_name"),
+                "datetime_modified": note_query.pop("subject_datetime_modified"),
+            }, metadata=metadata)
+            note_value = convert_note_query_to_dictionary(note_query, subject_query)
+
+            if cached_is_dir(str(subject_query["path"])) is False:
+                if delete_in_db is True:
+                    notes_cursor.execute(DELETE_SUBJECT_SQL_STATEMENT, (subject_query["id"],))
+                dangling_error = exceptions.DanglingSubjectError(subject_query)
+            elif cached_is_file(str(note_value["path"])) is False:
+                if delete_in_db:
+                    notes_cursor.execute(DELETE_NOTE_SQL_STATEMENT, (note_query["id"],))
+                dangling_error = exceptions.DanglingSubjectNoteFoundError(subject, [note_value])
+
+    # the subject is searched on its own only to know what is missing
+    if note_query is None:
+        get_subject(subject, delete_in_db=delete_in_db, metadata=metadata)
+        raise exceptions.NoSubjectNoteFoundError(subject, [note])
+
+    if dangling_error is not None:
+        raise dangling_error
+
+    return note_value
+
+
+def get_subject_notes(subject, *notes, **kwargs):
+    """
+    Retrieves a list of notes under the given subject. Query data results are similar to the `get_subject_note`
+    function.
+
+    :param subject: The subject from where the notes to be retrieved.
+    :type subject: str
+
+    :param notes: A list of the titles of the notes to be searched.
+    :type notes: list[str]
+
+    :keyword strict: Indicates that the function will raise an exception if there are missing and dangling notes.
+                     It is disabled by default.
+
+    :keyword delete_in_db: Deletes the note entry in the database if it's found to be a dangling note. It is
+                           enabled by default.
+
+    :return: A tuple that is made up of three items: a list of dictionaries similar to the data returned
+             from `get_subject_note` function, a list of note titles that are not found, and a list of dangling notes
+             with their data similar to the first list.
+    :rtype: tuple[list]
+
+    :raises NoSubjectFoundError: When the subject is not found in the database.
+    :raises DanglingSubjectError: When the subject is found in the database but not in the filesystem.
+    :raises MultipleSubjectNoteError: Raises an exception if the function is in strict mode and there are missing and
+                                      dangling notes.
+    """
+    profile_metadata = kwargs.pop("metadata")
+    strict = kwargs.pop("strict", False)
+    delete_in_db = kwargs.pop("delete_in_db", True)
+
+    subject_query = get_subject(subject, delete_in_db=delete_in_db, metadata=profile_metadata)
+    return find_subject_notes(subject_query, *notes, strict=strict, delete_in_db=delete_in_db,
+                              metadata=profile_metadata)
+
+
+def select_subject_notes(notes_cursor, subject_query, note_titles):
+    """
+    Selects the rows of the notes with the given titles under a subject without checking their files. The notes are
+    searched in batches of `IN (...)` queries instead of one query for each note.
+
+    :param notes_cursor: The database cursor to be used.
+    :type notes_cursor: sqlite3.Cursor
+
+    :param subject_query: The subject of the notes similar to the data from `get_subject`.
+    :type subject_query: dict
+
+    :param note_titles: The (stripped) titles of the notes to be selected.
+    :type note_titles: list[str]
+
+    :return: The rows of the found notes in no particular order.
+    :rtype: list[dict]
+    """
+    notes_query = []
+    for notes_chunk in chunk_list(note_titles, constants.NOTES_DB_MAX_QUERY_VARIABLES):
+        placeholders, parameters = sql_parameter_list(notes_chunk)
+        notes_cursor.execute(f"SELECT id, subject_id, title, datetime_modified FROM notes WHERE "
+                             f"subject_id == ? AND title IN ({placeholders});",
+                             [subject_query["id"], *parameters])
+        notes_query.extend(notes_cursor.fetchall())
+
+    return notes_query
+
+
+def find_subject_notes(subject_query, *notes, strict=False, delete_in_db=True, metadata=None):
+    """
+    Similar to `get_subject_notes` but with the data of an already retrieved subject so the subject is not searched
+    again.
+
+    :param subject_query: The subject from where the notes to be retrieved similar to the data from `get_subject`.
+    :type subject_query: dict
+
+    :param notes: A list of the titles of the notes to be searched.
+    :type notes: list[str]
+
+    :param strict: Indicates that the function will raise an exception if there are missing and dangling notes.
+    :type strict: bool
+
+    :param delete_in_db: Deletes the note entry in the database if it's found to be a dangling note.
+    :type delete_in_db: bool
+
+    :return: A tuple similar to `get_subject_notes`.
+    :rtype: tuple[list]
 
-        note_value = convert_note_query_to_dictionary(note_query, subject_query)
+    :raises MultipleSubjectNoteError: Raises an exception if the function is in strict mode and there are missing and
+                                      dangling notes.
+    """
+    with use_db(metadata["db"]) as (notes_cursor, notes_db):
+        # this will eventually be the list for notes that are not found
+        notes_set = deduplicate_list(note.strip() for note in notes)
+        notes_query = select_subject_notes(notes_cursor, subject_query, notes_set)
+
+        # the found notes are returned in the order they were given
+        note_positions = {note: index for (index, note) in enumerate(notes_set)}
+
+        # the subject directory is only scanned once instead of checking each note file
+        note_files = get_file_names(subject_query["path"])
+
+        found_notes = []
+        dangling_notes = []
+        for _note in notes_query:
+            note = convert_note_query_to_dictionary(_note, subject_query)
 
-        if note_value["path"].is_file() is False:
-            if delete_in_db:
-                notes_cursor.execute("DELETE FROM notes WHERE id == :note_id;", {"note_id": note_query["id"]})
-                notes_db.commit()
-            raise exceptions.DanglingSubjectNoteFoundError(subject, [note_value])
+            if note["path"].name not in note_files:
+                dangling_notes.append(note)
+            else:
+                found_notes.append(note)
 
-        return note_value
+        # the dangling notes are deleted all at once
+        if delete_in_db is True and len(dangling_notes) > 0:
+            notes_cursor.executemany(DELETE_NOTE_SQL_STATEMENT, [(note["id"],) for note in dangling_notes])
+
+    # the remaining note titles are the one that is not found in the database
+    found_note_titles = {note["title"] for note in notes_query}
+    notes_set = [note for note in notes_set if note not in found_note_titles]
+
+    # the error is only raised after the transaction so the deletion of the dangling notes is committed
+    if (len(notes_set) > 0 or len(dangling_notes) > 0) and strict is True:
+        raise exceptions.MultipleSubjectNoteError(subject_query["name"], notes_set, dangling_notes)
+
+    found_notes.sort(key=lambda note: note_positions[note["title"]])
+
+    return found_notes, notes_set, dangling_notes
 
 
 def get_subject_note_by_id(id, delete_in_db=True, metadata=None):
@@ -400,24 +542,21 @@ def get_subject_note_by_id(id, delete_in_db=True, metadata=None):
                             "id == :id;", {"id": id})
         note_query = notes_cursor.fetchone()
 
-        if note_query is None:
-            raise exceptions.NoSubjectNoteFoundError(None, id)
-        
-        try:
-            subject_query = get_subject_by_id(note_query["subject_id"], delete_in_db=delete_in_db, metadata=metadata)
-        except (exceptions.NoSubjectFoundError, exceptions.DanglingSubjectError) as error:
-            raise error
+    if note_query is None:
+        raise exceptions.NoSubjectNoteFoundError(None, id)
 
-        note_query = convert_note_query_to_dictionary(note_query, subject_query)
-        
-        if note_query["path"].is_file() is False:
-            if delete_in_db is True:
-                if delete_in_db:
-                        notes_cursor.execute("DELETE FROM notes WHERE id == :note_id;", {"note_id": note_query["id"]})
-                        notes_db.commit()
-                raise exceptions.DanglingSubjectNoteFoundError(subject, [note_query])
+    # the subject is retrieved in its own transaction so the deletion of a dangling subject is committed
+    subject_query = get_subject_by_id(note_query["subject_id"], delete_in_db=delete_in_db, metadata=metadata)
+
+    note_query = convert_note_query_to_dictionary(note_query, subject_query)
 
-        return note_query
+    if cached_is_file(str(note_query["path"])) is False:
+        if delete_in_db is True:
+            with use_db(metadata["db"]) as (notes_cursor, notes_db):
+                notes_cursor.execute(DELETE_NOTE_SQL_STATEMENT, (note_query["id"],))
+        raise exceptions.DanglingSubjectNoteFoundError(subject_query["name"], [note_query])
+
+    return note_query
 
 def get_all_subject_notes(subject, sort_by=None, strict=False, delete_in_db=True, metadata=None):
     """Retrieve all notes under the given subject.
@@ -445,11 +584,52 @@ def get_all_subject_notes(subject, sort_by=None, strict=False, delete_in_db=True
     :raises DanglingSubjectError: When the given subject is found to be dangling.
     :raises DanglingSubjectNotesError: When there are dangling subjects note found and the function is set to strict mode.
     """
+    subject = subject.strip(" -")
+    subject_query = get_subject(subject, delete_in_db=True, metadata=metadata)
+
+    return find_all_subject_notes(subject_query, sort_by=sort_by, strict=strict, delete_in_db=delete_in_db,
+                                  metadata=metadata)
+
+
+# The notes of a subject are usually retrieved more than once in a command (e.g., compiling all of the notes with the
+# main note) so the results are kept with the state of the database and the subject directory at the time. Only the
+# results without dangling notes are kept. The notes are kept as tuples of their items so the callers can freely modify
+# the notes they get without affecting the cached results.
+SUBJECT_NOTES_CACHE = {}
+
+
+def find_all_subject_notes(subject_query, sort_by=None, strict=False, delete_in_db=True, metadata=None):
+    """Similar to `get_all_subject_notes` but with the data of an already retrieved subject so the subject is not
+    searched again. The results are cached until the database or the subject directory has been modified.
+
+    :param subject_query: The subject to be retrieve all of the notes similar to the data from `get_subject`.
+    :type subject_query: dict
+
+    :param sort_by: The column to be based how the results should be ordered. Choices include
+                    "title", "id", and "date". Any invalid choices are not sorted in any way.
+    :type sort_by: str
+
+    :param strict: Indicates if the program should raise if there's dangling notes in the database.
+    :type strict: bool
+
+    :param delete_in_db: Indicates if the function should delete dangling notes entry in the database.
+    :type delete_in_db: bool
+
+    :return: A tuple similar to `get_all_subject_notes`.
+    :rtype: tuple[list]
+
+    :raises DanglingSubjectNotesError: When there are dangling subjects note found and the function is set to strict mode.
+    """
+    # the modification time of the directory changes whenever a note file is added or removed
     try:
-        subject = subject.strip(" -")
-        subject_query = get_subject(subject, delete_in_db=True, metadata=metadata)
-    except (exceptions.NoSubjectFoundError, exceptions.DanglingSubjectError) as error:
-        raise error
+        subject_signature = (os.stat(subject_query["path"]).st_mtime_ns, metadata["db"].total_changes)
+    except OSError:
+        subject_signature = None
+
+    cache_key = (metadata["notes"], subject_query["id"], sort_by)
+    cached_notes = SUBJECT_NOTES_CACHE.get(cache_key, None)
+    if subject_signature is not None and cached_notes is not None and cached_notes[0] == subject_signature:
+        return [dict(note) for note in cached_notes[1]], []
 
     with use_db(metadata["db"]) as (notes_cursor, notes_db):
         sql_statement = "SELECT id, title, subject_id, datetime_modified FROM notes " \
@@ -465,27 +645,32 @@ def get_all_subject_notes(subject, sort_by=None, strict=False, delete_in_db=True
         # getting the subject notes
         notes_cursor.execute(sql_statement, {"subject_id": subject_query["id"]})
 
-        notes_query = notes_cursor.fetchall()
+        notes_query = []
         dangling_notes = []
 
-        for (index, _note) in enumerate(notes_query):
+        # the subject directory is only scanned once instead of checking each note file
+        note_files = get_file_names(subject_query["path"])
+
+        for _note in notes_cursor.fetchall():
             note = convert_note_query_to_dictionary(_note, subject_query)
-            notes_query[index] = note
 
-            if note["path"].is_file() is False:
-                if delete_in_db:
-                    notes_cursor.execute("DELETE FROM notes WHERE id == :note_id;", {"note_id": _note["note_id"]})
-                    notes_db.commit()
+            if note["path"].name not in note_files:
+                dangling_notes.append(note)
+            else:
+                notes_query.append(note)
 
-                dangling_notes.append(index)
-                continue
+        # the dangling notes are deleted all at once
+        if delete_in_db is True and len(dangling_notes) > 0:
+            notes_cursor.executemany(DELETE_NOTE_SQL_STATEMENT, [(note["id"],) for note in dangling_notes])
 
-        dangling_notes[:] = [notes_query.pop(index) for index in dangling_notes]
+    # the error is only raised after the transaction so the deletion of the dangling notes is committed
+    if len(dangling_notes) > 0 and strict is True:
+        raise exceptions.DanglingSubjectNoteFoundError(subject_query["name"], dangling_notes)
 
-        if len(dangling_notes) > 0 and strict is True:
-            raise exceptions.DanglingSubjectNoteFoundError(dangling_notes)
+    if subject_signature is not None and len(dangling_notes) == 0:
+        SUBJECT_NOTES_CACHE[cache_key] = (subject_signature, tuple(tuple(note.items()) for note in notes_query))
 
-        return notes_query, dangling_notes
+    return notes_query, dangling_notes
 
 
 def create_subject(subject, metadata=None):
@@ -507,46 +692,79 @@ def create_subject(subject, metadata=None):
     """
     subject = subject.strip(" -")
 
-    if subject.lower() in constants.INVALID_SUBJECT_NAMES is True:
+    if subject.lower() in constants.INVALID_SUBJECT_NAMES:
         raise ValueError(f"Given name is one of the keywords.")
-    elif regex_match(subject, constants.SUBJECT_NAME_REGEX) is False:
+    elif SUBJECT_NAME_PATTERN.search(subject) is None:
         raise ValueError(f"Given name contains invalid characters.")
-    elif regex_match(subject, "^\d+$") is True:
+    elif NUMERIC_NAME_PATTERN.search(subject) is not None:
         raise ValueError(f"Given name contains invalid characters")
 
     with use_db(metadata["db"]) as (notes_cursor, notes_db):
-        subject_slug = kebab_case(subject)
         try:
             notes_cursor.execute("INSERT INTO subjects (name, datetime_modified) VALUES (:name, DATETIME());",
                              {"name": subject})
-            notes_db.commit()
         except sqlite3.IntegrityError as error:
             raise exceptions.SubjectAlreadyExists(subject)
-        except sqlite3.Error as error:
-            raise error
 
-        subject_folder_path = metadata["notes"] / subject_slug
+        # the inserted subject is retrieved by its ID instead of searching it again
+        notes_cursor.execute("SELECT id, name, datetime_modified FROM subjects WHERE id == :subject_id;",
+                             {"subject_id": notes_cursor.lastrowid})
+        subject_query = convert_subject_query_to_dictionary(notes_cursor.fetchone(), metadata=metadata)
+
+        # the files of the subject are only created once the subject has been committed
+        call_after_commit(notes_db, create_subject_files, subject_query["path"], metadata=metadata)
+
+    return subject_query
+
+
+def create_subject_files(subject_folder_path, metadata=None):
+    """Creates the folder of a subject along with its files (e.g., the bibliography and the latexmkrc link).
+
+    :param subject_folder_path: The folder of the subject.
+    :type subject_folder_path: Path
 
-        # creating the folder for the subject
-        subject_folder_path.mkdir(exist_ok=True)
+    :return: Has no return value.
+    :rtype: None
+    """
+    # creating the folder for the subject
+    subject_folder_path.mkdir(exist_ok=True)
+    clear_path_caches()
+
+    # creating the `graphics/` folder in the subject directory
+    subject_graphics_folder_path = subject_folder_path / "graphics/"
+    subject_graphics_folder_path.mkdir(exist_ok=True)
 
-        # creating the `graphics/` folder in the subject directory
-        subject_graphics_folder_path = subject_folder_path / "graphics/"
-        subject_graphics_folder_path.mkdir(exist_ok=True)
+    # creating the symbolic link for the stylesheet directory which should only
+    # be two levels up in the root directory
+    latexmk_symbolic_link_path = subject_folder_path / "latexmkrc"
 
-        # creating the symbolic link for the stylesheet directory which should only
-        # be two levels up in the root directory
-        latexmk_symbolic_link_path = subject_folder_path / "latexmkrc"
+    # the link itself is removed (without following it) so a dangling link is also replaced
+    # it is simply unlinked without checking if it exists beforehand
+    # an entry that cannot be unlinked (e.g., a directory) is left as it is similar to an existing link
+    try:
+        os.unlink(latexmk_symbolic_link_path)
+    except (FileNotFoundError, IsADirectoryError, PermissionError):
+        pass
 
-        if latexmk_symbolic_link_path.is_file():
-            latexmk_symbolic_link_path.unlink()
+    create_symbolic_link(metadata["profile"] / "latexmkrc", subject_folder_path, "latexmkrc")
 
-        symbolic_link_creation_process = create_symbolic_link(metadata["profile"] / "latexmkrc", subject_folder_path, "latexmkrc")
+    bibfile = subject_folder_path / "ref.bib"
+    bibfile.touch()
+
+
+def is_valid_note_title(note_title):
+    """
+    Checks if the given (stripped) note title can be stored in the binder.
+    The keywords are checked case-insensitively similar to the check constraint in the database.
 
-        bibfile = subject_folder_path / "ref.bib"
-        bibfile.touch()
+    :param note_title: The title of the note.
+    :type note_title: str
 
-        return get_subject(subject, metadata=metadata)
+    :return: Whether the note title is valid.
+    :rtype: bool
+    """
+    return note_title.lower() not in constants.INVALID_NOTE_TITLES and len(note_title) <= 256 \
+        and NUMERIC_NAME_PATTERN.search(note_title) is None
 
 
 def create_subject_note(subject, note_title, force=False, metadata=None):
@@ -575,93 +793,175 @@ def create_subject_note(subject, note_title, force=False, metadata=None):
                         or length is not at range.
     :raises sqlite3.Error: When the SQLite3 goes something wrong.
     """
-    # making sure the note doesn't exists before continuing
-    try:
-        note = get_subject_note(subject, note_title, delete_in_db=True, metadata=metadata)
-        raise exceptions.SubjectNoteAlreadyExistError(subject, [note])
-    except (exceptions.NoSubjectFoundError, exceptions.DanglingSubjectError) as error:
-        raise error
-    except (exceptions.NoSubjectNoteFoundError, exceptions.DanglingSubjectNoteFoundError) as error:
-        pass
-    except exceptions.SubjectNoteAlreadyExistError as error:
-        raise error
-
-    if note_title in constants.INVALID_NOTE_TITLES or len(note_title) > 256:
-        raise ValueError(subject, note_title)
-    if regex_match(note_title, "^\d+$") is True:
+    # the title is validated the same way it is stored
+    # this is done first since it doesn't need anything from the database
+    note_title = note_title.strip()
+    if is_valid_note_title(note_title) is False:
         raise ValueError(subject, note_title)
 
-    note_title = note_title.strip()
+    # the subject is only retrieved once for the whole creation
+    subject_query = get_subject(subject, delete_in_db=True, metadata=metadata)
+
     with use_db(metadata["db"]) as (notes_cursor, notes_db):
-        try:
-            notes_cursor.execute("INSERT INTO notes (title, subject_id, datetime_modified) VALUES "
-                                 "(:title, (SELECT id FROM subjects WHERE name == :subject), "
-                                 "DATETIME());",
-                                 {"title": note_title, "subject": subject})
-        except sqlite3.DatabaseError as error:
-            raise error
+        # making sure the note doesn't exists before continuing
+        # only the note itself is checked instead of scanning the whole subject directory
+        notes_cursor.execute("SELECT id, subject_id, title, datetime_modified FROM notes WHERE "
+                             "subject_id == :subject_id AND title == :title;",
+                             {"title": note_title, "subject_id": subject_query["id"]})
+        existing_note = notes_cursor.fetchone()
+        if existing_note is not None:
+            existing_note = convert_note_query_to_dictionary(existing_note, subject_query)
+            if cached_is_file(str(existing_note["path"])) is True:
+                raise exceptions.SubjectNoteAlreadyExistError(subject, [existing_note])
 
-        subject_query = get_subject(subject, delete_in_db=True, metadata=metadata)
+            # the dangling note is deleted in the database so it can be created again
+            notes_cursor.execute(DELETE_NOTE_SQL_STATEMENT, (existing_note["id"],))
 
-        note_title_slug = kebab_case(note_title)
-        note_title_filepath = subject_query["path"] / (note_title_slug + ".tex")
+        notes_cursor.execute("INSERT INTO notes (title, subject_id, datetime_modified) VALUES "
+                             "(:title, :subject_id, DATETIME());",
+                             {"title": note_title, "subject_id": subject_query["id"]})
 
-        if note_title_filepath.is_file() is False or force is True:
-            note_title_filepath.touch(exist_ok=True)
+        # the inserted note is retrieved by its ID instead of searching it again
+        notes_cursor.execute("SELECT id, subject_id, title, datetime_modified FROM notes WHERE id == :note_id;",
+                             {"note_id": notes_cursor.lastrowid})
+        note = convert_note_query_to_dictionary(notes_cursor.fetchone(), subject_query)
 
-            with note_title_filepath.open(mode="w") as note_file:
-                today = date.today()
+        # the file of the note is only created once the note has been committed
+        call_after_commit(notes_db, create_note_file, note_title, note["path"], force=force)
 
-                custom_config = {}
-                for config_key, config_value in constants.DEFAULT_LATEX_DOC_CONFIG.items():
-                    custom_config[f"__{config_key}__"] = config_value
+    return note
 
-                latex_subfile_source_template = Template(constants.config["DEFAULT_LATEX_SUBFILE_SOURCE_CODE"])
-                note_file.write(
-                    latex_subfile_source_template.safe_substitute(__date__=today.strftime("%B %d, %Y"),
-                                                                             __title__=note_title,
-                                                                             **custom_config)
-                )
 
-    return get_subject_note(subject, note_title, metadata=metadata)
+def create_note_file(note_title, note_filepath, force=False, today=None):
+    """Writes the LaTeX source of a new note into its file.
 
+    :param note_title: The title of the note.
+    :type note_title: str
 
-def create_main_note(subject, _preface=None, strict=False, metadata=None,  **kwargs):
-    try:
-        subject_query = get_subject(subject, metadata=metadata)
-    except (exceptions.DanglingSubjectError, exceptions.NoSubjectFoundError) as error:
-        raise error
+    :param note_filepath: The path of the file of the note.
+    :type note_filepath: Path
 
-    try:
-        subject_notes_query = get_all_subject_notes(subject, strict=strict, delete_in_db=True, metadata=metadata)
-    except exceptions.DanglingSubjectNoteFoundError as error:
-        raise error
+    :param force: Overwrite the file if it already exists. Otherwise, the already existing file is kept as it is.
+    :type force: bool
+
+    :param today: The formatted date to be used in the note. If none was given, the current date is formatted.
+                  Useful for creating several notes with the date only formatted once.
+    :type today: str
+
+    :return: Has no return value.
+    :rtype: None
+    """
+    if cached_is_file(str(note_filepath)) is False or force is True:
+        note_filepath.touch(exist_ok=True)
+        clear_path_caches()
+
+        if today is None:
+            today = date.today().strftime("%B %d, %Y")
+
+        with note_filepath.open(mode="w") as note_file:
+            custom_config = {}
+            for config_key, config_value in constants.DEFAULT_LATEX_DOC_CONFIG.items():
+                custom_config[f"__{config_key}__"] = config_value
+
+            latex_subfile_source_template = constants.get_template(constants.config["DEFAULT_LATEX_SUBFILE_SOURCE_CODE"])
+            note_file.write(
+                latex_subfile_source_template.safe_substitute(__date__=today,
+                                                              __title__=note_title,
+                                                              **custom_config)
+            )
+
+
+def create_subject_notes(subject, *note_titles, force=False, metadata=None):
+    """Create multiple notes under a subject in the binder. Unlike calling `create_subject_note` for each note, the
+    notes are inserted into the database all at once.
+
+    :param subject: The subject where the notes will belong.
+    :type subject: str
+
+    :param note_titles: The titles of the notes.
+    :type note_titles: list[str]
+
+    :param force: Force insertion of the files, if they already exist in the filesystem.
+    :type force: bool
+
+    :return: A tuple made up of three items: a list of the newly inserted notes similar to the data from
+             `get_subject_notes`, a list of the titles that already exist in the binder, and a list of the invalid
+             titles.
+    :rtype: tuple[list]
+
+    :raises NoSubjectFoundError: When the subject given doesn't exist in the database.
+    :raises DanglingSubjectError: When the subject is found to be dangling.
+    """
+    subject_query = get_subject(subject, delete_in_db=True, metadata=metadata)
+
+    # the new note titles are kept in an (ordered) dictionary for constant time lookups and removals
+    new_note_titles = {}
+    existing_note_titles = []
+    invalid_note_titles = []
+    for note_title in (note_title.strip() for note_title in note_titles):
+        if is_valid_note_title(note_title) is False:
+            invalid_note_titles.append(note_title)
+        elif note_title in new_note_titles:
+            existing_note_titles.append(note_title)
+        else:
+            new_note_titles[note_title] = None
+
+    # the dangling notes are deleted in the database so they can be created again
+    existing_notes = find_subject_notes(subject_query, *new_note_titles, metadata=metadata)[0]
+    for note in existing_notes:
+        del new_note_titles[note["title"]]
+        existing_note_titles.append(note["title"])
+
+    with use_db(metadata["db"]) as (notes_cursor, notes_db):
+        notes_cursor.executemany("INSERT INTO notes (title, subject_id, datetime_modified) VALUES "
+                                 "(?, ?, DATETIME());",
+                                 [(note_title, subject_query["id"]) for note_title in new_note_titles])
+
+        # the inserted notes are retrieved without checking their files since they're not created yet
+        note_positions = {note_title: index for (index, note_title) in enumerate(new_note_titles)}
+        new_notes = sorted((convert_note_query_to_dictionary(note, subject_query)
+                            for note in select_subject_notes(notes_cursor, subject_query, list(new_note_titles))),
+                           key=lambda note: note_positions[note["title"]])
+
+        # the files of the notes are only created once the notes have been committed
+        today = date.today().strftime("%B %d, %Y")
+        for note in new_notes:
+            call_after_commit(notes_db, create_note_file, note["title"], note["path"], force=force, today=today)
+
+    return new_notes, existing_note_titles, invalid_note_titles
+
+
+def create_main_note(subject, _preface=None, strict=False, metadata=None,  **kwargs):
+    subject_query = get_subject(subject, metadata=metadata)
+    subject_notes_query = find_all_subject_notes(subject_query, strict=strict, delete_in_db=True, metadata=metadata)
 
     custom_config = {}
     if _preface is not None:
-        preface = f"\\chapter{{Preface}}\n{Template(_preface).safe_substitute(__subject__=subject)}\n\\newpage\n"
+        preface = f"\\chapter{{Preface}}\n" \
+                  f"{constants.get_template(_preface).safe_substitute(__subject__=subject)}\n\\newpage\n"
     else:
         preface_file = subject_query["path"] / "README.txt"
         preface = ""
 
-        if preface_file.is_file() is True:
+        # the preface file is simply opened instead of checking if it exists beforehand
+        try:
             with preface_file.open(mode="r") as subject_preface_file:
                 preface_text = subject_preface_file.read()
                 preface = f"\\chapter{{Preface}}\n" \
                           f"{Template(preface_text).safe_substitute(__subject__=subject)}\n\\newpage\n"
+        except (FileNotFoundError, IsADirectoryError):
+            pass
 
-    main_content = ""
-    today = date.today()
-
-    for note in subject_notes_query[0]:
-        main_content += f"\\part{{{note['title']}}}\n\\inputchilddocument{{{note['slug']}}}\n\n"
+    today = date.today().strftime("%B %d, %Y")
+    main_content = "".join(f"\\part{{{note['title']}}}\n\\inputchilddocument{{{note['slug']}}}\n\n"
+                           for note in subject_notes_query[0])
 
     for key in constants.DEFAULT_LATEX_DOC_KEY_LIST:
         if key in constants.DEFAULT_LATEX_DOC_KEY_LIST_KEYWORDS:
             continue
 
         _value = constants.DEFAULT_LATEX_DOC_CONFIG.get(key, "")
-        value = Template(_value).safe_substitute(__subject__=subject, __date__=today.strftime("%B %d, %Y"))
+        value = constants.get_template(_value).safe_substitute(__subject__=subject, __date__=today)
         custom_config[f"__{key}__"] = value
 
     for key in constants.DEFAULT_LATEX_MAIN_FILE_DOC_KEY_LIST:
@@ -669,18 +969,18 @@ def create_main_note(subject, _preface=None, strict=False, metadata=None,  **kwa
             continue
 
         _value = constants.DEFAULT_LATEX_MAIN_FILE_DOC_KEY_CONFIG.get(key, "")
-        value = Template(_value).safe_substitute(__subject__=subject, __date__=today.strftime("%B %d, %Y"))
+        value = constants.get_template(_value).safe_substitute(__subject__=subject, __date__=today)
         custom_config[f"__{key}__"] = value
 
     main_note_filepath = subject_query["path"] / f"{constants.MAIN_SUBJECT_TEX_FILENAME}.tex"
-    main_note_filepath.touch(exist_ok=True)
+    latex_main_file_source_template = constants.get_template(constants.config["DEFAULT_LATEX_MAIN_FILE_SOURCE_CODE"])
     with main_note_filepath.open(mode="w") as main_note:
         main_note.write(
-            constants.config["DEFAULT_LATEX_MAIN_FILE_TEMPLATE"].safe_substitute(__date__=today.strftime("%B %d, %Y"),
-                                                                       __title__=subject,
-                                                                       __preface__=preface,
-                                                                       __main__=main_content,
-                                                                       **custom_config)
+            latex_main_file_source_template.safe_substitute(__date__=today,
+                                                            __title__=subject,
+                                                            __preface__=preface,
+                                                            __main__=main_content,
+                                                            **custom_config)
         )
 
 
@@ -702,7 +1002,8 @@ def create_subject_graphics(subject, *figures, **kwargs):
 
 
 def remove_subject(subject, delete, metadata=None):
-    """Simply removes the subject from the binder.
+    """Simply removes the subject from the binder. The notes of the subject are removed along with it in the same
+    statement through the cascading foreign key of the notes.
 
     :param subject: The subject to be removed.
     :type subject: str
@@ -718,18 +1019,29 @@ def remove_subject(subject, delete, metadata=None):
 
     :raises NoSubjectFoundError: When the subject doesn't exist in the database.
     """
-    try:
-        subject = subject.strip(" -")
-        subject_query = get_subject(subject, delete_in_db=True, metadata=metadata)
-    except (exceptions.NoSubjectFoundError, exceptions.DanglingSubjectError) as error:
-        raise error
+    subject = subject.strip(" -")
 
+    # the subject is deleted and retrieved with one statement if possible
+    # a dangling subject is simply removed since it doesn't matter if its folder exists or not
     with use_db(metadata["db"]) as (notes_cursor, notes_db):
-        notes_cursor.execute("DELETE FROM subjects WHERE id == :subject_id;",
-                         {"subject_id": subject_query["id"]})
+        if SQLITE_SUPPORTS_RETURNING:
+            notes_cursor.execute("DELETE FROM subjects WHERE name == :name RETURNING id, name, datetime_modified;",
+                                 {"name": subject})
+            subject_query = notes_cursor.fetchone()
+        else:
+            notes_cursor.execute("SELECT id, name, datetime_modified FROM subjects WHERE name == :name;",
+                                 {"name": subject})
+            subject_query = notes_cursor.fetchone()
+            if subject_query is not None:
+                notes_cursor.execute(DELETE_SUBJECT_SQL_STATEMENT, (subject_query["id"],))
+
+    if subject_query is None:
+        raise exceptions.NoSubjectFoundError(subject)
+
+    subject_query = convert_subject_query_to_dictionary(subject_query, metadata=metadata)
 
     if delete:
-        rmtree(subject_query["path"], ignore_errors=True)
+        call_after_commit(metadata["db"], delete_paths, [subject_query["path"]], directories=True)
 
     return subject_query
 
@@ -743,13 +1055,25 @@ def remove_all_subjects(delete=False, metadata=None):
     :param db: The database connection to be used. If none was provided, it'll create and use the default connection.
     :type db: sqlite3.Connection
 
-    :return: The data of the subjects being deleted.
-    :rtype: int
+    :return: A tuple similar to `get_all_subjects` where the first item is the list of the removed subjects. The
+             fetched rows are extended in place so the removed subjects are not copied for the results.
+    :rtype: tuple[list]
     """
-    subjects_query = get_all_subjects(metadata=metadata)
+    # an empty binder doesn't need to acquire the write lock at all
+    if metadata["db"].execute("SELECT EXISTS (SELECT 1 FROM subjects) AS has_subjects;").fetchone()["has_subjects"] == 0:
+        return ([], [])
+
+    # the subjects are retrieved and deleted in one transaction
+    with use_db(metadata["db"], immediate=True) as (notes_cursor, notes_db):
+        subjects_query = get_all_subjects(metadata=metadata)
 
-    for subject in subjects_query[0]:
-        remove_subject(subject["name"], delete=delete, metadata=metadata)
+        # the dangling subjects are already deleted so all of the subjects can be deleted with one statement
+        # the notes of the subjects are deleted along with them
+        notes_cursor.execute("DELETE FROM subjects;")
+
+    if delete:
+        call_after_commit(metadata["db"], delete_paths, [subject["path"] for subject in subjects_query[0]],
+                          directories=True)
 
     return subjects_query
 
@@ -777,25 +1101,136 @@ def remove_subject_note(subject, note, delete_on_disk=False, metadata=None):
     :raises NoSubjectNoteFoundError: When the subject note is not found in the database.
     :raises DanglingSubjectNoteError: When the subject is found in the database but the corresponding file is missing.
     """
-    try:
-        note_query = get_subject_note(subject, note, delete_in_db=True, metadata=metadata)
-    except exceptions.Error as error:
-        raise error
+    # the subject is retrieved in its own transaction so the deletion of a dangling subject is committed
+    subject_query = get_subject(subject, delete_in_db=True, metadata=metadata)
+    note = note.strip()
 
     with use_db(metadata["db"]) as (notes_cursor, notes_db):
-        notes_cursor.execute("DELETE FROM notes WHERE id == :note_id;", {"note_id": note_query["id"]})
+        # the note is deleted and retrieved with one statement if possible
+        note_query_arguments = {"subject_id": subject_query["id"], "title": note}
+        if SQLITE_SUPPORTS_RETURNING:
+            notes_cursor.execute("DELETE FROM notes WHERE subject_id == :subject_id AND title == :title "
+                                 "RETURNING id, subject_id, title, datetime_modified;", note_query_arguments)
+            note_query = notes_cursor.fetchone()
+        else:
+            notes_cursor.execute("SELECT id, subject_id, title, datetime_modified FROM notes WHERE "
+                                 "subject_id == :subject_id AND title == :title;", note_query_arguments)
+            note_query = notes_cursor.fetchone()
+            if note_query is not None:
+                notes_cursor.execute(DELETE_NOTE_SQL_STATEMENT, (note_query["id"],))
+
+    if note_query is None:
+        raise exceptions.NoSubjectNoteFoundError(subject, [note])
+
+    note_query = convert_note_query_to_dictionary(note_query, subject_query)
+
+    # similar to `get_subject_note`, the dangling note is deleted in the database before raising
+    if cached_is_file(str(note_query["path"])) is False:
+        raise exceptions.DanglingSubjectNoteFoundError(subject, [note_query])
 
-        if delete_on_disk is True:
-            note_query["path"].unlink()
+    if delete_on_disk is True:
+        call_after_commit(metadata["db"], delete_paths, [note_query["path"]])
 
     return note_query
 
 
+def remove_notes(notes, delete_on_disk=False, metadata=None):
+    """Removes the given notes in the binder all at once.
+
+    :param notes: The notes to be removed similar to the data from `get_subject_notes`.
+    :type notes: list[dict]
+
+    :param delete_on_disk: If enabled, simply removes the associated files of the notes from the disk.
+    :type delete_on_disk: bool
+
+    :return: Has no return value.
+    :rtype: None
+    """
+    with use_db(metadata["db"]) as (notes_cursor, notes_db):
+        notes_cursor.executemany(DELETE_NOTE_SQL_STATEMENT, [(note["id"],) for note in notes])
+
+    if delete_on_disk is True:
+        call_after_commit(metadata["db"], delete_paths, [note["path"] for note in notes])
+
+
+def remove_subject_notes(subject, *notes, delete_on_disk=False, metadata=None):
+    """Removes multiple notes under a subject in the binder.
+
+    :param subject: The name of the subject where the notes belong.
+    :type subject: str
+
+    :param notes: The titles of the notes to be removed.
+    :type notes: list[str]
+
+    :param delete_on_disk: If enabled, simply removes the associated files of the notes from the disk.
+    :type delete_on_disk: bool
+
+    :return: A tuple similar to `get_subject_notes` where the first item is the list of the removed notes.
+    :rtype: tuple[list]
+
+    :raises NoSubjectFoundError: When the subject is not found in the database.
+    :raises DanglingSubjectError: When the subject is not found in the filesystem.
+    """
+    # the subject is retrieved in its own transaction so the deletion of a dangling subject is committed
+    subject_query = get_subject(subject, delete_in_db=True, metadata=metadata)
+
+    # the notes are retrieved and deleted in one transaction
+    with use_db(metadata["db"], immediate=True):
+        notes_query = find_subject_notes(subject_query, *notes, delete_in_db=True, metadata=metadata)
+        remove_notes(notes_query[0], delete_on_disk=delete_on_disk, metadata=metadata)
+
+    return notes_query
+
+
 def remove_all_subject_notes(subject, delete_on_disk=False, metadata=None):
-    notes_query = get_all_subject_notes(subject, delete_in_db=True, metadata=metadata)
+    """Removes all of the notes under a subject in the binder.
 
-    for note in notes_query[0]:
-        remove_subject_note(subject, note["title"], delete_on_disk=delete_on_disk, metadata=metadata)
+    :param subject: The name of the subject where the notes belong.
+    :type subject: str
+
+    :param delete_on_disk: If enabled, simply removes the associated files of the notes from the disk.
+    :type delete_on_disk: bool
+
+    :return: A tuple similar to `get_all_subject_notes` where the first item is the list of the removed notes. The
+             fetched rows are extended in place so the removed notes are not copied for the results.
+    :rtype: tuple[list]
+
+    :raises NoSubjectFoundError: When the subject is not found in the database.
+    :raises DanglingSubjectError: When the subject is not found in the filesystem.
+    """
+    subject_query = get_subject(subject.strip(" -"), delete_in_db=True, metadata=metadata)
+
+    # a subject without notes doesn't need to acquire the write lock at all
+    if metadata["db"].execute("SELECT EXISTS (SELECT 1 FROM notes WHERE subject_id == :subject_id) AS has_notes;",
+                              {"subject_id": subject_query["id"]}).fetchone()["has_notes"] == 0:
+        return ([], [])
+
+    # the notes are retrieved and deleted in one transaction
+    with use_db(metadata["db"], immediate=True) as (notes_cursor, notes_db):
+        # all of the notes are deleted with one statement instead of deleting each of them
+        # the deleted notes are also retrieved from the same statement if possible
+        # otherwise, the rows are simply selected beforehand without sorting them or checking each of them
+        if SQLITE_SUPPORTS_RETURNING:
+            notes_cursor.execute("DELETE FROM notes WHERE subject_id == :subject_id "
+                                 "RETURNING id, subject_id, title, datetime_modified;",
+                                 {"subject_id": subject_query["id"]})
+            removed_notes = notes_cursor.fetchall()
+        else:
+            notes_cursor.execute("SELECT id, subject_id, title, datetime_modified FROM notes "
+                                 "WHERE subject_id == :subject_id;", {"subject_id": subject_query["id"]})
+            removed_notes = notes_cursor.fetchall()
+            notes_cursor.execute("DELETE FROM notes WHERE subject_id == :subject_id;",
+                                 {"subject_id": subject_query["id"]})
+
+    # the removed notes are then split with one directory scan
+    note_files = get_file_names(subject_query["path"])
+    notes_query = ([], [])
+    for _note in removed_notes:
+        note = convert_note_query_to_dictionary(_note, subject_query)
+        notes_query[0 if note["path"].name in note_files else 1].append(note)
+
+    if delete_on_disk is True:
+        call_after_commit(metadata["db"], delete_paths, [note["path"] for note in notes_query[0]])
 
     return notes_query
 